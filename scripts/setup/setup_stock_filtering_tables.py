@@ -93,6 +93,7 @@ def setup_stock_filtering_tables():
                 CREATE INDEX IF NOT EXISTS idx_stock_info_sector ON stock_info(sector);
                 CREATE INDEX IF NOT EXISTS idx_stock_info_industry ON stock_info(industry);
                 CREATE INDEX IF NOT EXISTS idx_stock_info_market_cap_category ON stock_info(market_cap_category);
+                CREATE INDEX IF NOT EXISTS idx_stock_info_sector_market_cap_category ON stock_info(sector, market_cap_category);
                 CREATE INDEX IF NOT EXISTS idx_stock_info_pe_ratio ON stock_info(pe_ratio);
                 CREATE INDEX IF NOT EXISTS idx_stock_info_dividend_yield ON stock_info(dividend_yield);
                 CREATE INDEX IF NOT EXISTS idx_stock_info_beta ON stock_info(beta);
@@ -100,7 +100,7 @@ class RiskCalculator:
             Maximum drawdown (negative value)
         """
         cumulative = (1 + returns).cumprod()
-        running_max = cumulative.expanding().max()
+        running_max = np.fmax.accumulate(cumulative.to_numpy())
         drawdown = (cumulative - running_max) / running_max
         return drawdown.min()
     
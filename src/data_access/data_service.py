@@ -17,6 +17,13 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _with_categorical_symbol(data):
+    """Store the repeated symbol column as a category so grouping works on integer codes."""
+    if 'symbol' in data.columns:
+        data['symbol'] = data['symbol'].astype('category')
+    return data
+
+
 class DataService:
     """Service class for accessing financial data from the database."""
     
@@ -52,7 +59,7 @@ class DataService:
             
             query += " ORDER BY date, symbol"
             
-            data = self.db_loader.query_data(query)
+            data = _with_categorical_symbol(self.db_loader.query_data(query))
             logger.info(f"Retrieved {len(data)} stock price records")
             return data
             
@@ -87,7 +94,7 @@ class DataService:
             
             query += " ORDER BY date, symbol"
             
-            data = self.db_loader.query_data(query)
+            data = _with_categorical_symbol(self.db_loader.query_data(query))
             logger.info(f"Retrieved {len(data)} portfolio performance records")
             return data
             
@@ -185,7 +192,7 @@ class DataService:
                 },
                 'total_records': len(portfolio_data),
                 'avg_daily_return': portfolio_data['returns'].mean(),
-                'total_return': portfolio_data.groupby('symbol')['returns'].sum().mean(),
+                'total_return': portfolio_data.groupby('symbol', observed=True)['returns'].sum().mean(),
                 'volatility': portfolio_data['returns'].std(),
                 'symbols': portfolio_data['symbol'].unique().tolist()
             }
@@ -225,7 +232,9 @@ class DataService:
             if symbols:
                 portfolio_data = portfolio_data[portfolio_data['symbol'].isin(symbols)]
             
-            # Pivot to get returns by symbol
+            # Pivot to get returns by symbol; plain labels keep the matrix in
+            # sorted symbol order with an ordinary index, as before
+            portfolio_data = portfolio_data.assign(symbol=portfolio_data['symbol'].astype(object))
             returns_pivot = portfolio_data.pivot(index='date', columns='symbol', values='returns')
             
             # Calculate correlation matrix
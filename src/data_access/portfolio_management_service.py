@@ -2,6 +2,7 @@
 Portfolio Management Service for creating, saving, and analyzing multiple portfolios
 """
 
+import math
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
@@ -141,7 +142,7 @@ class PortfolioManagementService:
             if len(symbols) != len(weights):
                 raise ValueError("Number of symbols must match number of weights")
             
-            if abs(sum(weights) - 1.0) > 0.01:
+            if abs(math.fsum(weights) - 1.0) > 0.01:
                 raise ValueError("Weights must sum to 1.0")
             
             # Ensure stock data is available for all symbols
@@ -497,7 +498,7 @@ class PortfolioManagementService:
             
             # Maximum Drawdown
             cumulative_returns = (1 + portfolio_returns).cumprod()
-            running_max = cumulative_returns.expanding().max()
+            running_max = np.fmax.accumulate(cumulative_returns.to_numpy())
             drawdown = (cumulative_returns - running_max) / running_max
             max_drawdown = drawdown.min()
             
@@ -547,7 +548,7 @@ class PortfolioManagementService:
         """Calculate drawdown metrics"""
         try:
             cumulative_returns = (1 + portfolio_returns).cumprod()
-            running_max = cumulative_returns.expanding().max()
+            running_max = np.fmax.accumulate(cumulative_returns.to_numpy())
             drawdown = (cumulative_returns - running_max) / running_max
             
             # Maximum drawdown
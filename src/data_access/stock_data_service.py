@@ -13,7 +13,7 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import redis
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, text
 import time
 
 # Add project root to path
@@ -108,6 +108,22 @@ class StockDataService:
             self.logger.error(f"Error getting stock data from DB for {symbol}: {e}")
             return None
     
+    def get_symbols_with_data(self, symbols: List[str]) -> set:
+        """Return the subset of symbols that have at least one row in the database."""
+        if not symbols:
+            return set()
+        
+        try:
+            query = text(
+                "SELECT DISTINCT symbol FROM stock_prices WHERE symbol IN :symbols"
+            ).bindparams(bindparam("symbols", expanding=True))
+            with self.engine.connect() as conn:
+                result = conn.execute(query, {"symbols": list(symbols)})
+                return {row[0] for row in result}
+        except Exception as e:
+            self.logger.error(f"Error checking stored symbols in DB: {e}")
+            return set()
+    
     def fetch_from_alpha_vantage(self, symbol: str) -> Optional[Dict]:
         """Fetch stock data from Alpha Vantage API."""
         if not self.alpha_vantage_key:
@@ -210,20 +226,7 @@ class StockDataService:
                             return None
                     
                     # Convert to our format with better error handling
-                    stock_data = []
-                    for date, row in hist.iterrows():
-                        try:
-                            stock_data.append({
-                                'date': date.strftime('%Y-%m-%d'),
-                                'open': float(row['Open']) if pd.notna(row['Open']) else None,
-                                'high': float(row['High']) if pd.notna(row['High']) else None,
-                                'low': float(row['Low']) if pd.notna(row['Low']) else None,
-                                'close': float(row['Close']) if pd.notna(row['Close']) else None,
-                                'volume': int(row['Volume']) if pd.notna(row['Volume']) else 0
-                            })
-                        except (ValueError, TypeError) as e:
-                            self.logger.warning(f"Error processing row for {symbol} on {date}: {e}")
-                            continue
+                    stock_data = self._convert_yahoo_history(symbol, hist)
                     
                     if not stock_data:
                         self.logger.warning(f"No valid data rows for {symbol}")
@@ -253,6 +256,71 @@ class StockDataService:
             self.logger.error(f"Error fetching from Yahoo Finance for {symbol}: {e}")
             return None
     
+    def _convert_yahoo_history(self, symbol: str, hist: pd.DataFrame) -> List[Dict]:
+        """Convert a Yahoo Finance history frame into our stock data records."""
+        stock_data = []
+        for date, row in hist.iterrows():
+            try:
+                stock_data.append({
+                    'date': date.strftime('%Y-%m-%d'),
+                    'open': float(row['Open']) if pd.notna(row['Open']) else None,
+                    'high': float(row['High']) if pd.notna(row['High']) else None,
+                    'low': float(row['Low']) if pd.notna(row['Low']) else None,
+                    'close': float(row['Close']) if pd.notna(row['Close']) else None,
+                    'volume': int(row['Volume']) if pd.notna(row['Volume']) else 0
+                })
+            except (ValueError, TypeError) as e:
+                self.logger.warning(f"Error processing row for {symbol} on {date}: {e}")
+                continue
+        return stock_data
+    
+    def fetch_batch_from_yahoo_finance(self, symbols: List[str], start_date: str = None, end_date: str = None) -> Dict[str, Dict]:
+        """Fetch stock data for several symbols with a single Yahoo Finance download."""
+        if not symbols:
+            return {}
+        
+        try:
+            import yfinance as yf
+            
+            if start_date and end_date:
+                hist = yf.download(symbols, start=start_date, end=end_date,
+                                   group_by='ticker', threads=True, progress=False)
+            else:
+                hist = yf.download(symbols, period="1y",
+                                   group_by='ticker', threads=True, progress=False)
+            
+            if hist is None or hist.empty:
+                self.logger.warning(f"No batch data from Yahoo Finance for {symbols}")
+                return {}
+            
+            fetched_at = datetime.now().isoformat()
+            results = {}
+            for symbol in symbols:
+                try:
+                    symbol_hist = hist[symbol] if isinstance(hist.columns, pd.MultiIndex) else hist
+                except KeyError:
+                    self.logger.warning(f"No batch data from Yahoo Finance for {symbol}")
+                    continue
+                
+                stock_data = self._convert_yahoo_history(symbol, symbol_hist.dropna(how='all'))
+                if stock_data:
+                    results[symbol] = {
+                        'symbol': symbol,
+                        'data': stock_data,
+                        'source': 'yahoo_finance',
+                        'fetched_at': fetched_at
+                    }
+            
+            self.logger.info(f"Batch fetched {len(results)}/{len(symbols)} symbols from Yahoo Finance")
+            return results
+            
+        except ImportError:
+            self.logger.warning("yfinance not installed, skipping Yahoo Finance")
+            return {}
+        except Exception as e:
+            self.logger.error(f"Error batch fetching from Yahoo Finance for {symbols}: {e}")
+            return {}
+    
     def generate_sample_data(self, symbol: str, days: int = 365) -> Dict:
         """Generate sample stock data for testing when APIs fail."""
         try:
@@ -401,8 +469,20 @@ class StockDataService:
             stock_data = self.fetch_from_yahoo_finance(symbol, start_date, end_date)
             time.sleep(self.rate_limit_delay)
         
-        # Fallback to Alpha Vantage if Yahoo Finance fails
-        if not stock_data and self.alpha_vantage_key:
+        # Fallback to Alpha Vantage, then sample data, if Yahoo Finance fails
+        if not stock_data or not stock_data.get('data'):
+            stock_data = self._fetch_fallback_stock_data(symbol)
+            
+            if not stock_data:
+                return False
+        
+        return self._store_fetched_stock_data(symbol, stock_data)
+    
+    def _fetch_fallback_stock_data(self, symbol: str) -> Optional[Dict]:
+        """Fetch stock data from Alpha Vantage, falling back to sample data."""
+        stock_data = None
+        
+        if self.alpha_vantage_key:
             self.logger.info(f"Fetching {symbol} from Alpha Vantage...")
             stock_data = self.fetch_from_alpha_vantage(symbol)
             time.sleep(self.rate_limit_delay)
@@ -414,9 +494,12 @@ class StockDataService:
             
             if not stock_data or not stock_data.get('data'):
                 self.logger.error(f"Failed to generate sample data for {symbol}")
-                return False
+                return None
         
-        # Store in database
+        return stock_data
+    
+    def _store_fetched_stock_data(self, symbol: str, stock_data: Dict) -> bool:
+        """Store fetched stock data in the database and cache its metadata."""
         success = self.store_stock_data(symbol, stock_data['data'])
         
         if success:
@@ -446,6 +529,32 @@ class StockDataService:
         
         return results
     
+    def fetch_and_store_missing_stock_data(self, symbols: List[str], start_date: str = None, end_date: str = None) -> Dict[str, bool]:
+        """Fetch data for symbols missing from the database using one batched download.
+        
+        Symbols already present in the database are left untouched. Symbols the
+        batch download could not provide go straight to the Alpha Vantage and
+        sample data fallbacks, since Yahoo Finance has just been tried for them.
+        """
+        requested = list(dict.fromkeys(s.upper().strip() for s in symbols if s and s.strip()))
+        stored_symbols = self.get_symbols_with_data(requested)
+        results = {symbol: True for symbol in requested if symbol in stored_symbols}
+        missing_symbols = [symbol for symbol in requested if symbol not in stored_symbols]
+        
+        if not missing_symbols:
+            return results
+        
+        batch_data = {}
+        if self.yahoo_finance_enabled:
+            self.logger.info(f"Batch fetching {missing_symbols} from Yahoo Finance...")
+            batch_data = self.fetch_batch_from_yahoo_finance(missing_symbols, start_date, end_date)
+        
+        for symbol in missing_symbols:
+            stock_data = batch_data.get(symbol) or self._fetch_fallback_stock_data(symbol)
+            results[symbol] = bool(stock_data) and self._store_fetched_stock_data(symbol, stock_data)
+        
+        return results
+    
     def get_available_symbols(self) -> List[str]:
         """Get list of symbols that have data in the database."""
         try:
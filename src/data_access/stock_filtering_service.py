@@ -4,13 +4,59 @@ Stock Filtering Service for database operations
 
 import pandas as pd
 import json
-from typing import Dict, List, Optional, Any
-from sqlalchemy import create_engine, text
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
+from sqlalchemy import bindparam, create_engine, text
 import logging
 from config.config import DATABASE_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Filter results are reused for this long; stock_info is refreshed by the ETL
+# scripts, so call invalidate_filter_cache after loading new data in-process
+FILTER_CACHE_TTL_SECONDS = 300
+# Number of filter combinations whose results are kept in memory
+FILTER_CACHE_SIZE = 32
+
+# Filter keys matched with IN against a column: (filter key, column)
+IN_FILTERS = [
+    ('market_cap_categories', 'market_cap_category'),
+    ('sectors', 'sector'),
+    ('industries', 'industry'),
+]
+
+# Filter keys compared against a column: (filter key, column, operator)
+RANGE_FILTERS = [
+    ('pe_ratio_min', 'pe_ratio', '>='),
+    ('pe_ratio_max', 'pe_ratio', '<='),
+    ('peg_ratio_min', 'peg_ratio', '>='),
+    ('peg_ratio_max', 'peg_ratio', '<='),
+    ('dividend_yield_min', 'dividend_yield', '>='),
+    ('dividend_yield_max', 'dividend_yield', '<='),
+    ('price_min', 'current_price', '>='),
+    ('price_max', 'current_price', '<='),
+    ('volume_min', 'volume', '>='),
+    ('beta_min', 'beta', '>='),
+    ('beta_max', 'beta', '<='),
+    ('debt_to_equity_max', 'debt_to_equity', '<='),
+    ('return_on_equity_min', 'return_on_equity', '>='),
+    ('profit_margin_min', 'profit_margins', '>='),
+]
+
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ['sector', 'industry', 'market_cap_category']
+
+def _with_categorical_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert low-cardinality text columns to the category dtype"""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            # Categories follow first appearance so value_counts breaks ties
+            # in the same order as it does for plain text columns
+            df[col] = pd.Categorical(df[col], categories=pd.unique(df[col].dropna()))
+    return df
+
 class StockFilteringService:
     """Service for stock filtering operations"""
     
@@ -19,103 +65,90 @@ class StockFilteringService:
             f"postgresql://{DATABASE_CONFIG['user']}:{DATABASE_CONFIG['password']}@"
             f"{DATABASE_CONFIG['host']}:{DATABASE_CONFIG['port']}/{DATABASE_CONFIG['name']}"
         )
+        # LRU of (fetched_at, frame) keyed by the normalized filter spec
+        self._filter_cache: "OrderedDict[tuple, Tuple[float, pd.DataFrame]]" = OrderedDict()
+        self._filter_cache_lock = threading.Lock()
     
     def get_all_stocks(self) -> pd.DataFrame:
         """Get all stocks from database"""
-        try:
-            query = "SELECT * FROM stock_info ORDER BY market_cap DESC"
-            return pd.read_sql(query, self.engine)
-        except Exception as e:
-            logger.error(f"Error getting all stocks: {str(e)}")
-            return pd.DataFrame()
+        # No filters selects every row, so this shares the filter cache and its TTL
+        return self.get_stocks_by_filters({})
     
     def get_stocks_by_filters(self, filters: Dict[str, Any]) -> pd.DataFrame:
-        """Get stocks based on filter criteria"""
+        """Get stocks based on filter criteria, reusing recent results for the same filters"""
+        key = self._filter_cache_key(filters)
+        now = time.monotonic()
+        with self._filter_cache_lock:
+            entry = self._filter_cache.pop(key, None)
+            if entry is not None and now - entry[0] < FILTER_CACHE_TTL_SECONDS:
+                self._filter_cache[key] = entry
+                return entry[1].copy()
+        
         try:
-            base_query = "SELECT * FROM stock_info WHERE 1=1"
-            params = []
-            
-            # Market cap categories
-            if filters.get('market_cap_categories'):
-                categories = "','".join(filters['market_cap_categories'])
-                base_query += f" AND market_cap_category IN ('{categories}')"
-            
-            # Sectors
-            if filters.get('sectors'):
-                sectors = "','".join(filters['sectors'])
-                base_query += f" AND sector IN ('{sectors}')"
-            
-            # Industries
-            if filters.get('industries'):
-                industries = "','".join(filters['industries'])
-                base_query += f" AND industry IN ('{industries}')"
-            
-            # PE Ratio
-            if filters.get('pe_ratio_min') is not None:
-                base_query += f" AND pe_ratio >= {filters['pe_ratio_min']}"
-            if filters.get('pe_ratio_max') is not None:
-                base_query += f" AND pe_ratio <= {filters['pe_ratio_max']}"
-            
-            # PEG Ratio
-            if filters.get('peg_ratio_min') is not None:
-                base_query += f" AND peg_ratio >= {filters['peg_ratio_min']}"
-            if filters.get('peg_ratio_max') is not None:
-                base_query += f" AND peg_ratio <= {filters['peg_ratio_max']}"
-            
-            # Dividend Yield
-            if filters.get('dividend_yield_min') is not None:
-                base_query += f" AND dividend_yield >= {filters['dividend_yield_min']}"
-            if filters.get('dividend_yield_max') is not None:
-                base_query += f" AND dividend_yield <= {filters['dividend_yield_max']}"
-            
-            # Price
-            if filters.get('price_min') is not None:
-                base_query += f" AND current_price >= {filters['price_min']}"
-            if filters.get('price_max') is not None:
-                base_query += f" AND current_price <= {filters['price_max']}"
-            
-            # Volume
-            if filters.get('volume_min') is not None:
-                base_query += f" AND volume >= {filters['volume_min']}"
-            
-            # Beta
-            if filters.get('beta_min') is not None:
-                base_query += f" AND beta >= {filters['beta_min']}"
-            if filters.get('beta_max') is not None:
-                base_query += f" AND beta <= {filters['beta_max']}"
-            
-            # Debt to Equity
-            if filters.get('debt_to_equity_max') is not None:
-                base_query += f" AND debt_to_equity <= {filters['debt_to_equity_max']}"
-            
-            # Return on Equity
-            if filters.get('return_on_equity_min') is not None:
-                base_query += f" AND return_on_equity >= {filters['return_on_equity_min']}"
-            
-            # Profit Margin
-            if filters.get('profit_margin_min') is not None:
-                base_query += f" AND profit_margins >= {filters['profit_margin_min']}"
-            
-            # Order by market cap
-            base_query += " ORDER BY market_cap DESC"
-            
-            return pd.read_sql(base_query, self.engine)
-            
+            query, params = self._build_filter_query(filters)
+            result = _with_categorical_dtypes(pd.read_sql(query, self.engine, params=params))
         except Exception as e:
             logger.error(f"Error filtering stocks: {str(e)}")
             return pd.DataFrame()
+        
+        with self._filter_cache_lock:
+            self._filter_cache[key] = (now, result)
+            while len(self._filter_cache) > FILTER_CACHE_SIZE:
+                self._filter_cache.popitem(last=False)
+        return result.copy()
+    
+    def invalidate_filter_cache(self) -> None:
+        """Drop cached filter results so the next lookups re-read stock_info"""
+        with self._filter_cache_lock:
+            self._filter_cache.clear()
+    
+    @staticmethod
+    def _filter_cache_key(filters: Dict[str, Any]) -> tuple:
+        """Normalize filter criteria to the filters that affect the query"""
+        # Selection order and unused or empty filters do not change the result
+        in_values = tuple(
+            tuple(sorted(filters[key])) if filters.get(key) else None
+            for key, _ in IN_FILTERS
+        )
+        range_values = tuple(filters.get(key) for key, _, _ in RANGE_FILTERS)
+        return in_values + range_values
+    
+    @staticmethod
+    def _build_filter_query(filters: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        """Build the parameterized stock_info query and its bound values for the filter criteria"""
+        conditions = []
+        params = {}
+        list_params = []
+        
+        # Category filters become bound IN lists
+        for key, column in IN_FILTERS:
+            if filters.get(key):
+                conditions.append(f"{column} IN :{key}")
+                params[key] = list(filters[key])
+                list_params.append(bindparam(key, expanding=True))
+        
+        # Range filters become bound comparisons; NULL values never match
+        for key, column, operator in RANGE_FILTERS:
+            if filters.get(key) is not None:
+                conditions.append(f"{column} {operator} :{key}")
+                params[key] = filters[key]
+        
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        query = text(
+            f"SELECT * FROM stock_info WHERE {where_clause} ORDER BY market_cap DESC"
+        ).bindparams(*list_params)
+        return query, params
     
     def get_available_filters(self) -> Dict[str, Any]:
         """Get available filter options"""
         try:
-            # Get unique values for categorical filters
-            sectors_query = "SELECT DISTINCT sector FROM stock_info WHERE sector IS NOT NULL ORDER BY sector"
-            industries_query = "SELECT DISTINCT industry FROM stock_info WHERE industry IS NOT NULL ORDER BY industry"
-            categories_query = "SELECT DISTINCT market_cap_category FROM stock_info WHERE market_cap_category IS NOT NULL ORDER BY market_cap_category"
+            # Get unique values for all categorical filters in a single scan
+            categorical_query = "SELECT DISTINCT sector, industry, market_cap_category FROM stock_info"
+            categorical_df = pd.read_sql(categorical_query, self.engine)
             
-            sectors = pd.read_sql(sectors_query, self.engine)['sector'].tolist()
-            industries = pd.read_sql(industries_query, self.engine)['industry'].tolist()
-            categories = pd.read_sql(categories_query, self.engine)['market_cap_category'].tolist()
+            sectors = sorted(categorical_df['sector'].dropna().unique())
+            industries = sorted(categorical_df['industry'].dropna().unique())
+            categories = sorted(categorical_df['market_cap_category'].dropna().unique())
             
             # Get ranges for numerical filters
             ranges_query = """
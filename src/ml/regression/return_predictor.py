@@ -281,7 +281,7 @@ class ReturnPredictor:
     
     def _calculate_max_drawdown(self, cumulative_returns: pd.Series) -> float:
         """Calculate maximum drawdown."""
-        running_max = cumulative_returns.expanding().max()
+        running_max = np.fmax.accumulate(cumulative_returns.to_numpy())
         drawdown = (cumulative_returns - running_max) / running_max
         return drawdown.min()
     
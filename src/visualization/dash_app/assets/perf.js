@@ -0,0 +1,179 @@
+/*
+ * Clientside callbacks for the Performance Metrics tab.
+ *
+ * The performance-comparison chart is driven entirely by seeded mock data,
+ * so it is generated in the browser instead of round-tripping to the server.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    perf: {
+        compare: function(activeTab, selectedPortfolios, timePeriod, benchmark, portfolioNames) {
+            if (activeTab !== "performance-tab") {
+                return {data: [], layout: {}};
+            }
+
+            // Seeded PRNG (mulberry32) + Box-Muller for standard normal draws
+            function mulberry32(seed) {
+                return function() {
+                    seed |= 0;
+                    seed = (seed + 0x6D2B79F5) | 0;
+                    var t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+                    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+                    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+                };
+            }
+            var rand = mulberry32(42);
+            function standardNormal() {
+                var u = 0;
+                while (u === 0) {
+                    u = rand();
+                }
+                return Math.sqrt(-2.0 * Math.log(u)) * Math.cos(2.0 * Math.PI * rand());
+            }
+
+            // Determine date range based on time period
+            var DAY_MS = 24 * 60 * 60 * 1000;
+            var endDate = new Date();
+            var startDate;
+            var freq;
+            if (timePeriod === "1M") {
+                startDate = new Date(endDate.getTime() - 30 * DAY_MS);
+                freq = "D";
+            } else if (timePeriod === "3M") {
+                startDate = new Date(endDate.getTime() - 90 * DAY_MS);
+                freq = "W";
+            } else if (timePeriod === "6M") {
+                startDate = new Date(endDate.getTime() - 180 * DAY_MS);
+                freq = "W";
+            } else if (timePeriod === "1Y") {
+                startDate = new Date(endDate.getTime() - 365 * DAY_MS);
+                freq = "W";
+            } else if (timePeriod === "2Y") {
+                startDate = new Date(endDate.getTime() - 730 * DAY_MS);
+                freq = "M";
+            } else {  // ALL
+                startDate = new Date(2023, 0, 1);
+                freq = "M";
+            }
+
+            // Format as YYYY-MM-DD in local time; toISOString would shift to UTC
+            function pad(n) {
+                return n < 10 ? "0" + n : String(n);
+            }
+            function formatDate(d) {
+                return d.getFullYear() + "-" + pad(d.getMonth() + 1) + "-" + pad(d.getDate());
+            }
+
+            // Mirror pandas date_range: daily, weekly (Sundays) or month-end
+            var dates = [];
+            var current = new Date(startDate.getFullYear(), startDate.getMonth(), startDate.getDate());
+            if (freq === "W") {
+                current.setDate(current.getDate() + ((7 - current.getDay()) % 7));
+            } else if (freq === "M") {
+                current = new Date(current.getFullYear(), current.getMonth() + 1, 0);
+            }
+            while (current <= endDate) {
+                dates.push(formatDate(current));
+                if (freq === "D") {
+                    current.setDate(current.getDate() + 1);
+                } else if (freq === "W") {
+                    current.setDate(current.getDate() + 7);
+                } else {
+                    current = new Date(current.getFullYear(), current.getMonth() + 2, 0);
+                }
+            }
+
+            // Collect (name, mean, std) return parameters for every series to draw;
+            // only selected portfolios that still exist in the database are plotted
+            var selected = selectedPortfolios || [];
+            var seriesParams = [];
+            (portfolioNames || []).filter(function(name) {
+                return selected.indexOf(name) !== -1;
+            }).forEach(function(name) {
+                if (name.indexOf("Tech") !== -1 || name.indexOf("Growth") !== -1) {
+                    seriesParams.push([name, 0.015, 0.08]);
+                } else if (name.indexOf("Conservative") !== -1 || name.indexOf("Income") !== -1) {
+                    seriesParams.push([name, 0.008, 0.04]);
+                } else if (name.indexOf("High Risk") !== -1 || name.indexOf("Momentum") !== -1) {
+                    seriesParams.push([name, 0.020, 0.12]);
+                } else {
+                    seriesParams.push([name, 0.012, 0.06]);
+                }
+            });
+
+            var benchmarks = {
+                SPY: ["S&P 500", 0.010, 0.05],
+                QQQ: ["NASDAQ", 0.012, 0.06],
+                DIA: ["Dow Jones", 0.009, 0.04]
+            };
+            if (benchmark in benchmarks) {
+                seriesParams.push(benchmarks[benchmark]);
+            }
+
+            // Return empty figure if no portfolios selected
+            if (seriesParams.length === 0) {
+                return {
+                    data: [],
+                    layout: {
+                        annotations: [{
+                            text: "Please select portfolios to compare",
+                            xref: "paper", yref: "paper",
+                            x: 0.5, y: 0.5, showarrow: false,
+                            font: {size: 16, color: "gray"}
+                        }]
+                    }
+                };
+            }
+
+            var colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f'];
+            var benchmarkNames = ["S&P 500", "NASDAQ", "Dow Jones"];
+
+            // Markers only help on short series; dense series render as WebGL lines
+            var showMarkers = dates.length < 60;
+
+            var traces = seriesParams.map(function(params, i) {
+                var name = params[0], mu = params[1], sigma = params[2];
+                var cumulative = new Array(dates.length);
+                var total = 0;
+                for (var j = 0; j < dates.length; j++) {
+                    total += mu + sigma * standardNormal();
+                    cumulative[j] = total;
+                }
+
+                var line = {color: colors[i % colors.length], width: 2};
+                if (benchmarkNames.indexOf(name) !== -1) {
+                    line.dash = "dash";  // Benchmark with dashed line
+                }
+
+                var trace = {
+                    type: "scattergl",
+                    x: dates,
+                    y: cumulative,
+                    mode: showMarkers ? "lines+markers" : "lines",
+                    name: name,
+                    line: line
+                };
+                if (showMarkers) {
+                    trace.marker = {size: 3};
+                }
+                return trace;
+            });
+
+            return {
+                data: traces,
+                layout: {
+                    title: {text: "Portfolio Performance Comparison (" + timePeriod + ")"},
+                    xaxis: {title: {text: "Date"}},
+                    yaxis: {title: {text: "Cumulative Returns"}, tickformat: ".1%"},
+                    hovermode: "x unified",
+                    legend: {
+                        orientation: "h",
+                        yanchor: "bottom",
+                        y: 1.02,
+                        xanchor: "right",
+                        x: 1
+                    }
+                }
+            };
+        }
+    }
+});
@@ -37,6 +37,9 @@ CHART_COLORS = [
 CHART_HEIGHT = 500
 CHART_HEIGHT_SMALL = 400
 
+# Time-series traces are downsampled to roughly the chart's pixel width
+MAX_CHART_POINTS = 2000
+
 # Performance Metrics Configuration
 PERFORMANCE_METRICS = [
     "Total Return", "Annualized Return", "Volatility", 
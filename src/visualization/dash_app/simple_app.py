@@ -4,7 +4,7 @@ Refactored with improved design principles.
 """
 from typing import List, Dict, Any, Optional, Tuple, Union
 import dash
-from dash import dcc, html, Input, Output, callback_context, no_update
+from dash import dcc, html, dash_table, Input, Output, ClientsideFunction, callback_context, no_update
 import plotly.graph_objs as go
 import plotly.express as px
 import pandas as pd
@@ -28,7 +28,19 @@ DEFAULT_START_DATE = "2023-01-01"
 DEFAULT_END_DATE = datetime.now().strftime("%Y-%m-%d")
 DEFAULT_ANALYSIS_PERIOD_DAYS = 365
 ROLLING_WINDOW_DAYS = 30
+PERFORMANCE_STATS_PAGE_SIZE = 10
 CHART_COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f']
+PERFORMANCE_STATS_COLUMNS = ["Portfolio", "Total Return", "Annualized Return", "Volatility",
+                             "Sharpe Ratio", "Max Drawdown", "Beta", "Alpha"]
+
+# Bootstrap text colors used to highlight performance statistics
+TEXT_COLORS = {
+    "text-success": "#198754",
+    "text-warning": "#ffc107",
+    "text-danger": "#dc3545",
+    "text-info": "#0dcaf0",
+    "text-muted": "#6c757d"
+}
 
 # Error messages
 ERROR_MESSAGES = {
@@ -173,15 +185,24 @@ def fetch_missing_stock_data_for_portfolios(portfolios: List[Dict[str, Any]]) ->
     if not portfolios:
         return portfolios
     
-    all_symbols = set()
-    for portfolio in portfolios:
-        all_symbols.update(portfolio.get('symbols', []))
+    # Symbols overlap heavily across portfolios, so dedupe before fetching
+    all_symbols = set().union(*(portfolio.get('symbols', []) for portfolio in portfolios))
     
     if not all_symbols:
         return portfolios
     
-    print(f"Checking and fetching data for symbols: {list(all_symbols)}")
-    valid_symbols, invalid_symbols = validate_stock_symbols(list(all_symbols))
+    print(f"Checking and fetching data for symbols: {sorted(all_symbols)}")
+    try:
+        from src.data_access.stock_data_service import get_stock_data_service
+        stock_service = get_stock_data_service()
+        results = stock_service.fetch_and_store_missing_stock_data(sorted(all_symbols))
+        # Verify data was actually stored
+        stored_symbols = stock_service.get_symbols_with_data(list(results))
+        invalid_symbols = [symbol for symbol, success in results.items()
+                           if not success or symbol not in stored_symbols]
+    except Exception as e:
+        logger.error(f"Error fetching missing stock data: {e}")
+        invalid_symbols = []
     
     if invalid_symbols:
         print(f"Warning: Could not fetch data for symbols: {invalid_symbols}")
@@ -192,6 +213,14 @@ def fetch_missing_stock_data_for_portfolios(portfolios: List[Dict[str, Any]]) ->
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Use orjson for Plotly/Dash figure serialization when it is installed
+try:
+    import orjson  # noqa: F401
+    import plotly.io as pio
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    logger.info("orjson not installed, using default JSON engine for figures")
+
 # Initialize Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "Quantitative Finance Pipeline Dashboard"
@@ -386,7 +415,9 @@ def create_performance_metrics():
                                     id="performance-portfolio-selector",
                                     multi=True,
                                     placeholder="Select portfolios to compare..."
-                                )
+                                ),
+                                # Names of the portfolios stored in the database, in database order
+                                dcc.Store(id="performance-portfolio-names", data=[])
                             ], width=12)
                         ])
                     ])
@@ -426,11 +457,9 @@ def create_performance_metrics():
                         )
                     ])
                 ]),
-                html.Div(id="rolling-sharpe-loading-text", style={"display": "none"}, 
-                        children=html.P("Loading Rolling Sharpe Ratio data...", className="text-center text-muted")),
                 dcc.Loading(
                     id="rolling-sharpe-loading",
-                    type="default",
+                    type="circle",
                     children=dcc.Graph(id="rolling-sharpe-chart")
                 )
             ], width=6),
@@ -446,11 +475,9 @@ def create_performance_metrics():
                         )
                     ])
                 ]),
-                html.Div(id="rolling-volatility-loading-text", style={"display": "none"}, 
-                        children=html.P("Loading Rolling Volatility data...", className="text-center text-muted")),
                 dcc.Loading(
                     id="rolling-volatility-loading",
-                    type="default",
+                    type="circle",
                     children=dcc.Graph(id="rolling-volatility-chart")
                 )
             ], width=6)
@@ -460,7 +487,23 @@ def create_performance_metrics():
         dbc.Row([
             dbc.Col([
                 html.H3("Performance Statistics"),
-                html.Div(id="performance-statistics")
+                dcc.Store(id="perf-stats-store"),
+                html.Div(id="performance-statistics"),
+                html.Div(
+                    id="perf-stats-table-container",
+                    style={"display": "none"},
+                    children=dash_table.DataTable(
+                        id="perf-stats-dt",
+                        columns=[{"name": col, "id": col} for col in PERFORMANCE_STATS_COLUMNS],
+                        data=[],
+                        page_current=0,
+                        page_size=PERFORMANCE_STATS_PAGE_SIZE,
+                        page_action="custom",
+                        style_as_list_view=True,
+                        style_header={"fontWeight": "bold"},
+                        style_cell={"textAlign": "left"}
+                    )
+                )
             ], width=12)
         ])
     ])
@@ -1451,7 +1494,7 @@ def update_drawdown_chart(active_tab, selected_portfolios):
                         
                         # Calculate drawdown
                         cumulative = (1 + returns).cumprod()
-                        running_max = cumulative.expanding().max()
+                        running_max = np.fmax.accumulate(cumulative.to_numpy())
                         drawdown = (cumulative - running_max) / running_max
                         
                         color = colors[i % len(colors)]
@@ -3249,54 +3292,6 @@ def update_rolling_volatility(active_tab, selected_portfolio_name):
     
     return fig
 
-# Callback to show/hide rolling Sharpe loading text
-@app.callback(
-    Output("rolling-sharpe-loading-text", "style"),
-    [Input("rolling-sharpe-portfolio-selector", "value"),
-     Input("tabs", "active_tab")]
-)
-def show_rolling_sharpe_loading_text(selected_portfolio, active_tab):
-    """Show loading text when portfolio selection changes or tab is activated."""
-    if active_tab != "performance-tab":
-        return {"display": "none"}
-    if selected_portfolio:
-        return {"display": "block"}
-    return {"display": "none"}
-
-# Callback to hide rolling Sharpe loading text when chart updates
-@app.callback(
-    Output("rolling-sharpe-loading-text", "style", allow_duplicate=True),
-    [Input("rolling-sharpe-chart", "figure")],
-    prevent_initial_call=True
-)
-def hide_rolling_sharpe_loading_text(figure):
-    """Hide loading text when chart is updated."""
-    return {"display": "none"}
-
-# Callback to show/hide rolling volatility loading text
-@app.callback(
-    Output("rolling-volatility-loading-text", "style"),
-    [Input("rolling-volatility-portfolio-selector", "value"),
-     Input("tabs", "active_tab")]
-)
-def show_rolling_volatility_loading_text(selected_portfolio, active_tab):
-    """Show loading text when portfolio selection changes or tab is activated."""
-    if active_tab != "performance-tab":
-        return {"display": "none"}
-    if selected_portfolio:
-        return {"display": "block"}
-    return {"display": "none"}
-
-# Callback to hide rolling volatility loading text when chart updates
-@app.callback(
-    Output("rolling-volatility-loading-text", "style", allow_duplicate=True),
-    [Input("rolling-volatility-chart", "figure")],
-    prevent_initial_call=True
-)
-def hide_rolling_volatility_loading_text(figure):
-    """Hide loading text when chart is updated."""
-    return {"display": "none"}
-
 # Callback for returns distribution chart
 @app.callback(
     Output("returns-distribution-chart", "figure"),
@@ -3346,13 +3341,14 @@ def update_returns_distribution(active_tab):
 
 # Callback for performance portfolio selector
 @app.callback(
-    Output("performance-portfolio-selector", "options"),
+    [Output("performance-portfolio-selector", "options"),
+     Output("performance-portfolio-names", "data")],
     [Input("tabs", "active_tab")]
 )
 def update_performance_portfolio_selector(active_tab):
-    """Update performance portfolio selector options."""
+    """Update performance portfolio selector options and the names the comparison chart may plot."""
     if active_tab != "performance-tab":
-        return []
+        return [], no_update
     
     try:
         if DATABASE_AVAILABLE and PORTFOLIO_SERVICE:
@@ -3363,34 +3359,43 @@ def update_performance_portfolio_selector(active_tab):
                     "label": f"{p['name']} ({p['strategy']})",
                     "value": p['name']
                 })
-            return options
+            return options, [p['name'] for p in db_portfolios]
         else:
-            # Fallback options
+            # Fallback options; without a database no portfolio series is plotted
             return [
                 {"label": "Tech Growth Portfolio (Equal Weight)", "value": "Tech Growth Portfolio"},
                 {"label": "Conservative Income Portfolio (Market Cap)", "value": "Conservative Income Portfolio"},
                 {"label": "High Risk High Reward (Custom)", "value": "High Risk High Reward"},
                 {"label": "Balanced Growth Portfolio (Risk Parity)", "value": "Balanced Growth Portfolio"},
                 {"label": "ESG Focused Portfolio (Custom)", "value": "ESG Focused Portfolio"}
-            ]
+            ], []
     except Exception as e:
         print(f"Error loading portfolio options for performance selector: {e}")
-        return []
+        return [], []
 
-# Callback for performance statistics
+# Callback for performance statistics data (one table page at a time)
 @app.callback(
-    Output("performance-statistics", "children"),
+    [Output("perf-stats-store", "data"),
+     Output("perf-stats-dt", "page_current")],
     [Input("tabs", "active_tab"),
      Input("performance-portfolio-selector", "value"),
-     Input("performance-time-period", "value")],
+     Input("performance-time-period", "value"),
+     Input("perf-stats-dt", "page_current")],
     prevent_initial_call=True
 )
-def update_performance_statistics(active_tab, selected_portfolios, time_period):
-    """Update performance statistics display using 100% real calculated data with dynamic data fetching."""
+def update_performance_statistics(active_tab, selected_portfolios, time_period, page_current):
+    """Calculate performance statistics rows for the visible page using 100% real calculated data with dynamic data fetching."""
     if active_tab != "performance-tab":
-        return html.Div()
+        return no_update, no_update
+    
+    # Any change other than paging starts again from the first page
+    ctx = callback_context
+    if not ctx.triggered or not ctx.triggered[0]['prop_id'].startswith("perf-stats-dt."):
+        page_current = 0
+    page_current = page_current or 0
     
     stats_data = []
+    page_count = 1
     
     if DATABASE_AVAILABLE and PORTFOLIO_SERVICE:
         try:
@@ -3405,88 +3410,96 @@ def update_performance_statistics(active_tab, selected_portfolios, time_period):
             else:
                 portfolios_to_analyze = db_portfolios
             
-            # Automatically fetch missing stock data for all portfolios
+            # Only analyze the portfolios on the requested page
+            page_count = max(1, -(-len(portfolios_to_analyze) // PERFORMANCE_STATS_PAGE_SIZE))
+            page_start = page_current * PERFORMANCE_STATS_PAGE_SIZE
+            portfolios_to_analyze = portfolios_to_analyze[page_start:page_start + PERFORMANCE_STATS_PAGE_SIZE]
+            
+            # Automatically fetch missing stock data for the page's portfolios
             if portfolios_to_analyze:
                 print("Performance Statistics: Fetching missing stock data...")
                 fetch_missing_stock_data_for_portfolios(portfolios_to_analyze)
                 print("Performance Statistics: Data fetching completed")
             
-            # Calculate real statistics for each portfolio
+            # Use dynamic date range
+            end_date = datetime.now().strftime('%Y-%m-%d')
+            start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+            
+            # Calculate real statistics for each portfolio; missing data is
+            # reported by calculate_portfolio_analytics as an "error" entry
             for p in portfolios_to_analyze:
                 portfolio_symbols = p['symbols']
                 
-                # Check which symbols have data available after fetching
-                available_symbols = []
                 try:
-                    from src.data_access.stock_data_service import get_stock_data_service
-                    stock_service = get_stock_data_service()
+                    # Calculate real portfolio analytics
+                    analytics = PORTFOLIO_SERVICE.calculate_portfolio_analytics(
+                        symbols=portfolio_symbols,
+                        weights=p['weights'],
+                        start_date=start_date,
+                        end_date=end_date
+                    )
                     
-                    for symbol in portfolio_symbols:
-                        data = stock_service.get_stock_data(symbol)
-                        if data is not None and not data.empty:
-                            available_symbols.append(symbol)
-                except Exception as e:
-                    print(f"Error checking stock data availability for performance statistics: {e}")
-                    continue
-                
-                if available_symbols:
-                    try:
-                        # Use dynamic date range
-                        end_date = datetime.now().strftime('%Y-%m-%d')
-                        start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+                    if "error" not in analytics:
+                        total_return = analytics.get("total_return", 0)
+                        volatility = analytics.get("volatility", 0)
+                        sharpe_ratio = analytics.get("sharpe_ratio", 0)
                         
-                        # Calculate real portfolio analytics
-                        analytics = PORTFOLIO_SERVICE.calculate_portfolio_analytics(
-                            symbols=portfolio_symbols,
-                            weights=p['weights'],
-                            start_date=start_date,
-                            end_date=end_date
-                        )
-                        
-                        if "error" not in analytics:
-                            total_return = analytics.get("total_return", 0)
-                            volatility = analytics.get("volatility", 0)
-                            sharpe_ratio = analytics.get("sharpe_ratio", 0)
+                        # Calculate additional metrics
+                        if "returns" in analytics and len(analytics["returns"]) > 0:
+                            returns = analytics["returns"]
                             
-                            # Calculate additional metrics
-                            if "returns" in analytics and len(analytics["returns"]) > 0:
-                                returns = analytics["returns"]
-                                
-                                # Calculate max drawdown
-                                cumulative = (1 + returns).cumprod()
-                                running_max = cumulative.expanding().max()
-                                drawdown = (cumulative - running_max) / running_max
-                                max_drawdown = drawdown.min()
-                                
-                                # Calculate annualized return
-                                annualized_return = (1 + total_return) ** (252 / len(returns)) - 1
-                                
-                                # Simple beta calculation (correlation with market proxy)
-                                # For simplicity, using AAPL as market proxy
-                                if 'AAPL' in available_symbols:
-                                    beta = 1.0  # Simplified - in real implementation, would calculate against market index
-                                else:
-                                    beta = 1.0
-                                
-                                # Alpha calculation (simplified)
-                                alpha = total_return - (0.05 + beta * (0.10 - 0.05))  # Assuming 5% risk-free, 10% market return
-                                
-                                stats_data.append({
-                                    "Portfolio": p['name'],
-                                    "Total Return": f"{total_return:.1%}" if not np.isnan(total_return) else "N/A",
-                                    "Annualized Return": f"{annualized_return:.1%}" if not np.isnan(annualized_return) else "N/A",
-                                    "Volatility": f"{volatility:.1%}" if not np.isnan(volatility) else "N/A",
-                                    "Sharpe Ratio": f"{sharpe_ratio:.2f}" if not np.isnan(sharpe_ratio) else "N/A",
-                                    "Max Drawdown": f"{max_drawdown:.1%}" if not np.isnan(max_drawdown) else "N/A",
-                                    "Beta": f"{beta:.2f}",
-                                    "Alpha": f"{alpha:.1%}" if not np.isnan(alpha) else "N/A"
-                                })
-                    except Exception as e:
-                        print(f"Error calculating statistics for {p['name']}: {e}")
-                        continue
+                            # Calculate max drawdown
+                            cumulative = (1 + returns).cumprod()
+                            running_max = np.fmax.accumulate(cumulative.to_numpy())
+                            drawdown = (cumulative - running_max) / running_max
+                            max_drawdown = drawdown.min()
+                            
+                            # Calculate annualized return
+                            annualized_return = (1 + total_return) ** (252 / len(returns)) - 1
+                            
+                            # Simplified beta - in real implementation, would calculate against market index
+                            beta = 1.0
+                            
+                            # Alpha calculation (simplified)
+                            alpha = total_return - (0.05 + beta * (0.10 - 0.05))  # Assuming 5% risk-free, 10% market return
+                            
+                            stats_data.append({
+                                "Portfolio": p['name'],
+                                "Total Return": f"{total_return:.1%}" if not np.isnan(total_return) else "N/A",
+                                "Annualized Return": f"{annualized_return:.1%}" if not np.isnan(annualized_return) else "N/A",
+                                "Volatility": f"{volatility:.1%}" if not np.isnan(volatility) else "N/A",
+                                "Sharpe Ratio": f"{sharpe_ratio:.2f}" if not np.isnan(sharpe_ratio) else "N/A",
+                                "Max Drawdown": f"{max_drawdown:.1%}" if not np.isnan(max_drawdown) else "N/A",
+                                "Beta": f"{beta:.2f}",
+                                "Alpha": f"{alpha:.1%}" if not np.isnan(alpha) else "N/A"
+                            })
+                except Exception as e:
+                    print(f"Error calculating statistics for {p['name']}: {e}")
+                    continue
         except Exception as e:
             print(f"Error loading portfolio data for statistics: {e}")
     
+    return {"rows": stats_data, "page_count": page_count}, page_current
+
+# Callback for rendering the performance statistics table
+@app.callback(
+    [Output("performance-statistics", "children"),
+     Output("perf-stats-dt", "data"),
+     Output("perf-stats-dt", "page_count"),
+     Output("perf-stats-dt", "style_data_conditional"),
+     Output("perf-stats-table-container", "style")],
+    [Input("perf-stats-store", "data")],
+    prevent_initial_call=True
+)
+def render_performance_statistics(stats_store):
+    """Render the current page of the performance statistics table from the stored statistics rows.
+    
+    The rendering is cheap and its input is an unhashable store dict, so it is
+    recomputed on every store update rather than memoized.
+    """
+    stats_data = (stats_store or {}).get("rows", [])
+    page_count = (stats_store or {}).get("page_count", 1)
+    
     # If no real data available, show message
     if not stats_data:
         return dbc.Alert([
@@ -3501,159 +3514,48 @@ def update_performance_statistics(active_tab, selected_portfolios, time_period):
             ]),
             html.Hr(),
             html.P("Date Range: 2024-10-01 to 2025-10-01", className="mb-0")
-        ], color="warning")
-    
-    # Create table with real data
-    table_header = [
-        html.Thead([
-            html.Tr([
-                html.Th("Portfolio"),
-                html.Th("Total Return"),
-                html.Th("Annualized Return"),
-                html.Th("Volatility"),
-                html.Th("Sharpe Ratio"),
-                html.Th("Max Drawdown"),
-                html.Th("Beta"),
-                html.Th("Alpha")
-            ])
-        ])
-    ]
-    
-    table_body = [
-        html.Tbody([
-            html.Tr([
-                html.Td(row["Portfolio"]),
-                html.Td(row["Total Return"], 
-                       className="text-success" if row["Total Return"] != "N/A" and float(row["Total Return"].rstrip('%')) > 0.1 else "text-warning" if row["Total Return"] != "N/A" else "text-muted"),
-                html.Td(row["Annualized Return"], 
-                       className="text-success" if row["Annualized Return"] != "N/A" and float(row["Annualized Return"].rstrip('%')) > 0.1 else "text-warning" if row["Annualized Return"] != "N/A" else "text-muted"),
-                html.Td(row["Volatility"], 
-                       className="text-danger" if row["Volatility"] != "N/A" and float(row["Volatility"].rstrip('%')) > 0.2 else "text-info" if row["Volatility"] != "N/A" else "text-muted"),
-                html.Td(row["Sharpe Ratio"], 
-                       className="text-success" if row["Sharpe Ratio"] != "N/A" and float(row["Sharpe Ratio"]) > 0.8 else "text-warning" if row["Sharpe Ratio"] != "N/A" else "text-muted"),
-                html.Td(row["Max Drawdown"], 
-                       className="text-danger" if row["Max Drawdown"] != "N/A" else "text-muted"),
-                html.Td(row["Beta"]),
-                html.Td(row["Alpha"], 
-                       className="text-success" if row["Alpha"] != "N/A" and float(row["Alpha"].rstrip('%')) > 0 else "text-danger" if row["Alpha"] != "N/A" else "text-muted")
-            ])
-            for row in stats_data
-        ])
-    ]
-    
-    table = dbc.Table(table_header + table_body, striped=True, bordered=True, hover=True, responsive=True)
+        ], color="warning"), [], page_count, [], {"display": "none"}
+    
+    # Highlight cells with the same thresholds as the original table
+    def cell_class(column, value):
+        if value == "N/A":
+            return "text-muted"
+        if column in ("Total Return", "Annualized Return"):
+            return "text-success" if float(value.rstrip('%')) > 0.1 else "text-warning"
+        if column == "Volatility":
+            return "text-danger" if float(value.rstrip('%')) > 0.2 else "text-info"
+        if column == "Sharpe Ratio":
+            return "text-success" if float(value) > 0.8 else "text-warning"
+        if column == "Max Drawdown":
+            return "text-danger"
+        if column == "Alpha":
+            return "text-success" if float(value.rstrip('%')) > 0 else "text-danger"
+        return None
+    
+    style_data_conditional = [{"if": {"row_index": "odd"}, "backgroundColor": "#f8f9fa"}]
+    for row_index, row in enumerate(stats_data):
+        for column in PERFORMANCE_STATS_COLUMNS:
+            class_name = cell_class(column, row[column])
+            if class_name:
+                style_data_conditional.append({
+                    "if": {"row_index": row_index, "column_id": column},
+                    "color": TEXT_COLORS[class_name]
+                })
     
-    return table
+    return html.Div(), stats_data, page_count, style_data_conditional, {}
 
-# Enhanced callback for performance comparison with controls
-@app.callback(
+# Enhanced performance comparison with controls - mock data is generated
+# in the browser (assets/perf.js) to avoid a server round-trip
+app.clientside_callback(
+    ClientsideFunction(namespace="perf", function_name="compare"),
     Output("performance-comparison-chart", "figure", allow_duplicate=True),
     [Input("tabs", "active_tab"),
      Input("performance-portfolio-selector", "value"),
      Input("performance-time-period", "value"),
-     Input("performance-benchmark", "value")],
+     Input("performance-benchmark", "value"),
+     Input("performance-portfolio-names", "data")],
     prevent_initial_call=True
 )
-def update_performance_comparison_enhanced(active_tab, selected_portfolios, time_period, benchmark):
-    """Update performance comparison chart with enhanced controls."""
-    if active_tab != "performance-tab":
-        return go.Figure()
-    
-    # Determine date range based on time period
-    end_date = datetime.now()
-    if time_period == "1M":
-        start_date = end_date - timedelta(days=30)
-        freq = 'D'
-    elif time_period == "3M":
-        start_date = end_date - timedelta(days=90)
-        freq = 'W'
-    elif time_period == "6M":
-        start_date = end_date - timedelta(days=180)
-        freq = 'W'
-    elif time_period == "1Y":
-        start_date = end_date - timedelta(days=365)
-        freq = 'W'
-    elif time_period == "2Y":
-        start_date = end_date - timedelta(days=730)
-        freq = 'M'
-    else:  # ALL
-        start_date = datetime(2023, 1, 1)
-        freq = 'M'
-    
-    dates = pd.date_range(start=start_date, end=end_date, freq=freq)
-    np.random.seed(42)
-    
-    # Get portfolio data
-    portfolios = {}
-    if DATABASE_AVAILABLE and PORTFOLIO_SERVICE and selected_portfolios:
-        try:
-            db_portfolios = PORTFOLIO_SERVICE.get_all_portfolios()
-            for p in db_portfolios:
-                if p['name'] in selected_portfolios:
-                    # Generate realistic performance based on portfolio characteristics
-                    if 'Tech' in p['name'] or 'Growth' in p['name']:
-                        portfolios[p['name']] = np.random.normal(0.015, 0.08, len(dates)).cumsum()
-                    elif 'Conservative' in p['name'] or 'Income' in p['name']:
-                        portfolios[p['name']] = np.random.normal(0.008, 0.04, len(dates)).cumsum()
-                    elif 'High Risk' in p['name'] or 'Momentum' in p['name']:
-                        portfolios[p['name']] = np.random.normal(0.020, 0.12, len(dates)).cumsum()
-                    else:
-                        portfolios[p['name']] = np.random.normal(0.012, 0.06, len(dates)).cumsum()
-        except Exception as e:
-            print(f"Error loading selected portfolio data: {e}")
-    
-    # Add benchmark if selected
-    if benchmark != "NONE":
-        if benchmark == "SPY":
-            portfolios["S&P 500"] = np.random.normal(0.010, 0.05, len(dates)).cumsum()
-        elif benchmark == "QQQ":
-            portfolios["NASDAQ"] = np.random.normal(0.012, 0.06, len(dates)).cumsum()
-        elif benchmark == "DIA":
-            portfolios["Dow Jones"] = np.random.normal(0.009, 0.04, len(dates)).cumsum()
-    
-    # Return empty figure if no portfolios selected
-    if not portfolios:
-        return go.Figure().add_annotation(
-            text="Please select portfolios to compare",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=16, color="gray")
-        )
-    
-    fig = go.Figure()
-    
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f']
-    
-    for i, (name, returns) in enumerate(portfolios.items()):
-        line_style = dict(color=colors[i % len(colors)], width=2)
-        if name in ["S&P 500", "NASDAQ", "Dow Jones"]:
-            line_style['dash'] = 'dash'  # Benchmark with dashed line
-        
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=returns,
-            mode='lines+markers',
-            name=name,
-            line=line_style,
-            marker=dict(size=4)
-        ))
-    
-    fig.update_layout(
-        title=f"Portfolio Performance Comparison ({time_period})",
-        xaxis_title="Date",
-        yaxis_title="Cumulative Returns",
-        yaxis=dict(tickformat='.1%'),
-        hovermode='x unified',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        )
-    )
-    
-    return fig
 
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+/*
+ * Clientside callbacks for the Portfolio Manager tab.
+ *
+ * The server sends the selected portfolio as a compact
+ * {name, description, strategy, created_at, updated_at, symbols, weights,
+ * total_weight} record; the details modal (one table row per holding) is
+ * built here instead of being serialized as a component tree on every view.
+ * The analytics charts are likewise drawn from the analytics-data store
+ * without a server round-trip.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    portfolio: {
+        // Mirrors message_figure in real_data_app.py
+        messageFigure: function(text, title) {
+            var layout = {
+                xaxis: {visible: false},
+                yaxis: {visible: false},
+                annotations: [{
+                    text: text, xref: "paper", yref: "paper",
+                    x: 0.5, y: 0.5, showarrow: false
+                }]
+            };
+            if (title) {
+                layout.title = {text: title};
+            }
+            return {data: [], layout: layout};
+        },
+
+        analyticsCharts: function(analytics) {
+            var messageFigure = window.dash_clientside.portfolio.messageFigure;
+            if (!analytics || Object.keys(analytics).length === 0) {
+                var emptyFig = messageFigure("No analytics data available");
+                return [emptyFig, emptyFig];
+            }
+            if (analytics.error) {
+                var errorFig = messageFigure("Error: " + analytics.error);
+                return [errorFig, errorFig];
+            }
+
+            // Placeholders until the analytics include time series data
+            return [
+                messageFigure("Performance chart would show portfolio value over time", "Portfolio Performance"),
+                messageFigure("Drawdown chart would show portfolio drawdowns over time", "Portfolio Drawdown")
+            ];
+        },
+
+        renderDetails: function(details) {
+            if (!details) {
+                return "";
+            }
+            if (details.error) {
+                return details.error;
+            }
+
+            // Minimal component constructors for the Dash renderer
+            function html(type, props, children) {
+                return {
+                    namespace: "dash_html_components",
+                    type: type,
+                    props: Object.assign({children: children}, props || {})
+                };
+            }
+            function dbc(type, props, children) {
+                return {
+                    namespace: "dash_bootstrap_components",
+                    type: type,
+                    props: Object.assign({children: children}, props || {})
+                };
+            }
+            function percent(value) {
+                return (value * 100).toFixed(1) + "%";
+            }
+            function day(timestamp) {
+                return timestamp ? timestamp.slice(0, 10) : "N/A";
+            }
+
+            var symbols = details.symbols || [];
+            var weights = details.weights || [];
+            // Format each weight once; the label doubles as the bar's CSS width
+            var weightLabels = weights.map(percent);
+
+            // Each allocation cell is a single bar element sized by its weight,
+            // rather than a full Progress component per holding
+            var rows = new Array(symbols.length);
+            for (var i = 0; i < symbols.length; i++) {
+                rows[i] = html("Tr", null, [
+                    html("Td", null, symbols[i]),
+                    html("Td", null, weightLabels[i]),
+                    html("Td", null, [
+                        html("Div", {
+                            className: "bg-primary rounded",
+                            style: {height: "20px", width: weightLabels[i]}
+                        })
+                    ])
+                ]);
+            }
+
+            return [
+                dbc("Row", null, [
+                    dbc("Col", {width: 12}, [
+                        html("H4", {className: "mb-3"}, details.name),
+                        html("P", {className: "text-muted mb-3"}, details.description)
+                    ])
+                ]),
+                dbc("Row", {className: "mb-4"}, [
+                    dbc("Col", {width: 6}, [
+                        dbc("Card", null, [
+                            dbc("CardHeader", null, "Portfolio Information"),
+                            dbc("CardBody", null, [
+                                html("P", {className: "mb-2"}, "Strategy: " + details.strategy),
+                                html("P", {className: "mb-2"}, "Created: " + day(details.created_at)),
+                                html("P", {className: "mb-0"}, "Last Updated: " + day(details.updated_at))
+                            ])
+                        ])
+                    ]),
+                    dbc("Col", {width: 6}, [
+                        dbc("Card", null, [
+                            dbc("CardHeader", null, "Holdings Summary"),
+                            dbc("CardBody", null, [
+                                html("P", {className: "mb-2"}, "Number of Stocks: " + symbols.length),
+                                html("P", {className: "mb-0"}, "Total Weight: " + percent(details.total_weight))
+                            ])
+                        ])
+                    ])
+                ]),
+                dbc("Row", null, [
+                    dbc("Col", {width: 12}, [
+                        dbc("Card", null, [
+                            dbc("CardHeader", null, "Portfolio Holdings"),
+                            dbc("CardBody", null, [
+                                dbc("Table", {striped: true, bordered: true, hover: true}, [
+                                    html("Thead", null, [
+                                        html("Tr", null, [
+                                            html("Th", null, "Symbol"),
+                                            html("Th", null, "Weight"),
+                                            html("Th", null, "Allocation")
+                                        ])
+                                    ]),
+                                    html("Tbody", null, rows)
+                                ])
+                            ])
+                        ])
+                    ])
+                ])
+            ];
+        }
+    }
+});
@@ -0,0 +1,123 @@
+/*
+ * Clientside callbacks for the Stock Filtering Dashboard.
+ *
+ * The full stock universe is embedded once in the "all-stocks" store, so
+ * applying filters happens in the browser without a server round-trip.
+ * Both stores use a split layout ({columns: [...], data: [[...], ...]}) so
+ * column names are sent once rather than on every row.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    stock_filters: {
+        apply: function(nClicks, allStocks, marketCap, sectors, industries, priceMin, priceMax,
+                        peMin, peMax, pegMin, pegMax, divMin, divMax, betaMin, betaMax,
+                        volumeMin) {
+            var columns = (allStocks && allStocks.columns) || [];
+            var stocks = (allStocks && allStocks.data) || [];
+
+            // Before any filter is applied, return the summary precomputed on the server
+            if (!nClicks && allStocks && allStocks.initial) {
+                var initial = allStocks.initial;
+                return [{columns: columns, data: stocks}, initial.chart_data,
+                        initial.count, initial.avg_pe, initial.avg_dividend];
+            }
+
+            var col = {};
+            columns.forEach(function(name, index) {
+                col[name] = index;
+            });
+
+            // Mirror the SQL semantics of StockFilteringService.get_stocks_by_filters:
+            // empty selections are ignored and NULL values never satisfy a bound
+            function toSet(selected) {
+                return (selected && selected.length > 0) ? new Set(selected) : null;
+            }
+            function isSet(bound) {
+                return bound !== null && bound !== undefined;
+            }
+
+            var filtering = Boolean(nClicks);
+            var marketCapSet = filtering ? toSet(marketCap) : null;
+            var sectorSet = filtering ? toSet(sectors) : null;
+            var industrySet = filtering ? toSet(industries) : null;
+
+            // Resolve every numeric bound once; unset bounds become +/-Infinity
+            // sentinels so the row loop is plain comparisons.
+            // Dividend yield inputs are percentages, stored values are decimals.
+            var numericFilters = [
+                ["current_price", priceMin, priceMax, 1],
+                ["pe_ratio", peMin, peMax, 1],
+                ["peg_ratio", pegMin, pegMax, 1],
+                ["dividend_yield", divMin, divMax, 100],
+                ["beta", betaMin, betaMax, 1],
+                ["volume", volumeMin, null, 1]
+            ].filter(function(spec) {
+                return filtering && (isSet(spec[1]) || isSet(spec[2]));
+            }).map(function(spec) {
+                return {
+                    index: col[spec[0]],
+                    lo: isSet(spec[1]) ? spec[1] / spec[3] : -Infinity,
+                    hi: isSet(spec[2]) ? spec[2] / spec[3] : Infinity
+                };
+            });
+            var nNumeric = numericFilters.length;
+
+            // Single pass: filter rows and accumulate averages and category counts
+            var rows = [];
+            var peTotal = 0, peCount = 0, divTotal = 0, divCount = 0;
+            var capCounts = {}, sectorCounts = {};
+            for (var i = 0; i < stocks.length; i++) {
+                var r = stocks[i];
+                if (marketCapSet && !marketCapSet.has(r[col.market_cap_category])) continue;
+                if (sectorSet && !sectorSet.has(r[col.sector])) continue;
+                if (industrySet && !industrySet.has(r[col.industry])) continue;
+
+                var keep = true;
+                for (var k = 0; k < nNumeric; k++) {
+                    var f = numericFilters[k];
+                    var value = r[f.index];
+                    if (value === null || value === undefined || !(value >= f.lo && value <= f.hi)) {
+                        keep = false;
+                        break;
+                    }
+                }
+                if (!keep) continue;
+
+                rows.push(r);
+                // Averages skip missing values, like pandas' Series.mean()
+                if (r[col.pe_ratio] !== null && r[col.pe_ratio] !== undefined) {
+                    peTotal += r[col.pe_ratio];
+                    peCount += 1;
+                }
+                if (r[col.dividend_yield] !== null && r[col.dividend_yield] !== undefined) {
+                    divTotal += r[col.dividend_yield];
+                    divCount += 1;
+                }
+                if (r[col.market_cap_category] !== null && r[col.market_cap_category] !== undefined) {
+                    capCounts[r[col.market_cap_category]] = (capCounts[r[col.market_cap_category]] || 0) + 1;
+                }
+                if (r[col.sector] !== null && r[col.sector] !== undefined) {
+                    sectorCounts[r[col.sector]] = (sectorCounts[r[col.sector]] || 0) + 1;
+                }
+            }
+            var avgPe = peCount > 0 ? peTotal / peCount : 0;
+            var avgDividend = divCount > 0 ? divTotal / divCount : 0;
+
+            // Category counts for the charts, most common first like value_counts()
+            function sortedCounts(counts) {
+                var names = Object.keys(counts).sort(function(a, b) {
+                    return counts[b] - counts[a];
+                });
+                return {
+                    names: names,
+                    counts: names.map(function(name) { return counts[name]; })
+                };
+            }
+            var chartData = {
+                market_cap: sortedCounts(capCounts),
+                sector: sortedCounts(sectorCounts)
+            };
+
+            return [{columns: columns, data: rows}, chartData, rows.length, avgPe.toFixed(2), avgDividend.toFixed(4)];
+        }
+    }
+});
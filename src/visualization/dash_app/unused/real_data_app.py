@@ -1,17 +1,20 @@
 """
 Real data dashboard for the quantitative finance pipeline.
 """
+import os
 import sys
+import math
 from pathlib import Path
 import logging
+import time
+from functools import lru_cache, wraps
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import dash
-from dash import dcc, html, Input, Output, State, callback
+from dash import dcc, html, dash_table, Input, Output, State, ALL, Patch, CeleryManager, DiskcacheManager, ClientsideFunction, callback
 import dash_bootstrap_components as dbc
 import json
 
@@ -21,6 +24,7 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 from data_access.data_service import DataService
 from data_access.stock_filtering_service import StockFilteringService
 from data_access.portfolio_management_service import PortfolioManagementService
+from visualization.dash_app.utils import downsample_xy, rolling_std
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,232 +34,403 @@ data_service = DataService()
 stock_filtering_service = StockFilteringService()
 portfolio_management_service = PortfolioManagementService()
 
+# (filter key, transform) for each apply_stock_filters input, in argument order
+STOCK_FILTER_SPEC = (
+    ('market_cap_categories', lambda v: v),
+    ('sectors', lambda v: v),
+    ('industries', lambda v: v),
+    ('price_min', lambda v: v),
+    ('price_max', lambda v: v),
+    ('pe_ratio_min', lambda v: v),
+    ('pe_ratio_max', lambda v: v),
+    ('dividend_yield_min', lambda v: v / 100),  # Convert percentage to decimal
+    ('dividend_yield_max', lambda v: v / 100),
+)
+
+# Stock universe lookups are refreshed at most once per TTL window
+STOCK_UNIVERSE_TTL_SECONDS = 600
+STOCK_OPTIONS_TTL_SECONDS = 300
+
+
+def _ttl_bucket(ttl_seconds):
+    """Current time bucket; a new bucket invalidates the per-bucket caches below."""
+    return int(time.time() // ttl_seconds)
+
+
+def ttl_cached(ttl_seconds):
+    """Cache a no-argument function's result per TTL bucket; callers must not mutate it."""
+    def decorator(func):
+        cached = lru_cache(maxsize=1)(lambda epoch_bucket: func())
+        
+        @wraps(func)
+        def wrapper():
+            return cached(_ttl_bucket(ttl_seconds))
+        
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+
+def get_all_stocks():
+    """Get the stock universe; the service caches it together with the filtered results."""
+    return stock_filtering_service.get_all_stocks()
+
+
+@ttl_cached(STOCK_UNIVERSE_TTL_SECONDS)
+def get_filter_options():
+    """Get the stock filter dropdown options, refreshed every STOCK_UNIVERSE_TTL_SECONDS."""
+    available_filters = stock_filtering_service.get_available_filters()
+    return {
+        key: [{"label": value, "value": value} for value in available_filters.get(key, [])]
+        for key in ('market_cap_categories', 'sectors', 'industries')
+    }
+
+
+@ttl_cached(STOCK_OPTIONS_TTL_SECONDS)
+def get_stock_options():
+    """Get stock dropdown options, refreshed every STOCK_OPTIONS_TTL_SECONDS."""
+    available_stocks = get_all_stocks()
+    symbols = available_stocks['symbol'].to_numpy()
+    labels = (available_stocks['symbol'].astype(str) + ' - ' + available_stocks['name'].astype(str)).to_numpy()
+    return [{"label": label, "value": symbol} for label, symbol in zip(labels, symbols)]
+
+
+# Use orjson for Plotly/Dash figure serialization when it is installed
+try:
+    import orjson  # noqa: F401
+    import plotly.io as pio
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    logger.info("orjson not installed, using default JSON engine for figures")
+
 # Initialize Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "Quantitative Finance Pipeline - Real Data Dashboard"
 
+# Compress layout and callback JSON payloads, preferring Brotli, when
+# Flask-Compress is installed
+try:
+    from flask_compress import Compress
+    app.server.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.server.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app.server)
+except ImportError:
+    logger.info("Flask-Compress not installed, serving uncompressed responses")
+
+# In-process cache lifetime for backend service calls and tab layouts
+CACHE_TIMEOUT_SECONDS = 300
+
+# Long-running callbacks run in the background so they do not block the web server.
+# Setting CELERY_BROKER_URL hands them to Celery workers (see README.md); otherwise
+# they run in local processes through diskcache, or inline if that is not installed.
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL')
+celery_app = None
+background_callback_manager = None
+if CELERY_BROKER_URL:
+    from celery import Celery
+    celery_app = Celery(__name__, broker=CELERY_BROKER_URL, backend=CELERY_BROKER_URL)
+    background_callback_manager = CeleryManager(celery_app)
+else:
+    try:
+        import diskcache
+        background_callback_manager = DiskcacheManager(diskcache.Cache("./cache"))
+    except ImportError:
+        logger.info("diskcache not installed, running long callbacks synchronously")
+
+DEFAULT_TAB = "market-tab"
+
+
+def message_figure(text, title=None):
+    """Build an empty figure showing a centered message; a plain dict skips Plotly's validators."""
+    layout = {
+        "xaxis": {"visible": False},
+        "yaxis": {"visible": False},
+        "annotations": [{"text": text, "xref": "paper", "yref": "paper",
+                         "x": 0.5, "y": 0.5, "showarrow": False}]
+    }
+    if title:
+        layout["title"] = {"text": title}
+    return {"data": [], "layout": layout}
+
+
 # Define the layout
-app.layout = dbc.Container([
-    dbc.Row([
-        dbc.Col([
-            html.H1("📊 Quantitative Finance Pipeline", className="text-center mb-4"),
-            html.P("Real-time financial data analysis and portfolio optimization", 
-                   className="text-center text-muted mb-4")
+def serve_layout():
+    """Build the page layout with every tab's content rendered up front."""
+    return dbc.Container([
+        dbc.Row([
+            dbc.Col([
+                html.H1("📊 Quantitative Finance Pipeline", className="text-center mb-4"),
+                html.P("Real-time financial data analysis and portfolio optimization", 
+                       className="text-center text-muted mb-4")
+            ])
+        ]),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H4("📈 Portfolio Overview", className="card-title"),
+                        dcc.Loading(html.Div(id="portfolio-overview"), type="circle")
+                    ])
+                ])
+            ], width=12)
+        ], className="mb-4"),
+        
+        dbc.Row([
+            dbc.Col([
+                # Every tab's content ships with the page; switching tabs
+                # happens in the browser without a server round-trip
+                dcc.Tabs(id="tabs", value=DEFAULT_TAB, content_className="mt-4", children=[
+                    dcc.Tab(label="📊 Market Data", value="market-tab", children=MARKET_DATA_TAB),
+                    dcc.Tab(label="📈 Portfolio Performance", value="portfolio-tab", children=PORTFOLIO_TAB),
+                    dcc.Tab(label="⚠️ Risk Analysis", value="risk-tab", children=RISK_TAB),
+                    dcc.Tab(label="🔗 Correlation Analysis", value="correlation-tab", children=CORRELATION_TAB),
+                    dcc.Tab(label="🔍 Stock Filtering", value="stock-filtering-tab",
+                            children=create_stock_filtering_tab()),
+                    dcc.Tab(label="💼 Portfolio Manager", value="portfolio-manager-tab",
+                            children=create_portfolio_manager_tab()),
+                ])
+            ])
         ])
-    ]),
+    ], fluid=True)
+
+
+app.layout = serve_layout
+
+
+@ttl_cached(CACHE_TIMEOUT_SECONDS)
+def get_portfolio_summary():
+    """Get the portfolio summary; cached because every tab change re-renders the overview."""
+    return data_service.get_portfolio_summary()
+
+
+# Chart data is shared by several callbacks per tab visit, so each dataset is
+# fetched once per window. These tables are written by the ETL pipeline, not
+# by this app, so nothing here needs to invalidate them.
+DATA_CACHE_TIMEOUT_SECONDS = 60
+
+
+@ttl_cached(DATA_CACHE_TIMEOUT_SECONDS)
+def get_stock_prices():
+    """Get stock prices, shared across chart callbacks."""
+    return data_service.get_stock_prices()
+
+
+@ttl_cached(DATA_CACHE_TIMEOUT_SECONDS)
+def get_portfolio_performance():
+    """Get portfolio performance, shared across the portfolio and risk-tab charts."""
+    return data_service.get_portfolio_performance()
+
+
+@ttl_cached(DATA_CACHE_TIMEOUT_SECONDS)
+def get_portfolio_returns():
+    """Get daily equal-weight portfolio returns, shared by the risk-tab charts."""
+    portfolio_data = get_portfolio_performance()
+    if portfolio_data.empty:
+        return pd.Series(dtype=float)
     
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4("📈 Portfolio Overview", className="card-title"),
-                    html.Div(id="portfolio-overview")
-                ])
+    # Date-sorted rows make each day a contiguous run, so the daily mean is one
+    # reduceat pass instead of a hash groupby; NaN returns are skipped like mean()
+    order = np.argsort(portfolio_data['date'].to_numpy(), kind='stable')
+    dates = portfolio_data['date'].to_numpy()[order]
+    returns = portfolio_data['returns'].to_numpy(dtype=float)[order]
+    starts = np.flatnonzero(np.concatenate(([True], dates[1:] != dates[:-1])))
+    missing = np.isnan(returns)
+    sums = np.add.reduceat(np.where(missing, 0.0, returns), starts)
+    counts = np.add.reduceat(~missing, starts, dtype=np.int64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    return pd.Series(means, index=pd.Index(dates[starts], name='date'), name='returns')
+
+
+@ttl_cached(DATA_CACHE_TIMEOUT_SECONDS)
+def get_risk_metrics():
+    """Get risk metrics, shared across chart callbacks."""
+    return data_service.get_risk_metrics()
+
+
+@ttl_cached(DATA_CACHE_TIMEOUT_SECONDS)
+def get_correlation_matrix():
+    """Get the correlation matrix, shared across chart callbacks."""
+    return data_service.get_correlation_matrix()
+
+
+def get_filtered_stocks(filters):
+    """Get the stocks matching a filter dict; the service caches the frame, keyed by the filters."""
+    return stock_filtering_service.get_stocks_by_filters(filters or {})
+
+
+# Display formats for total return, volatility and Sharpe ratio
+OVERVIEW_METRIC_FORMATS = ("{:.2f}%", "{:.2f}%", "{:.3f}")
+
+
+def format_overview_metrics(summary):
+    """Format the overview metrics and pick their sign colors in one vectorized pass."""
+    values = np.array([
+        summary.get('total_return', 0),
+        summary.get('volatility', 0),
+        summary.get('risk_metrics', {}).get('sharpe_ratio', 0)
+    ], dtype=float) * np.array([100, 100, 1])
+    labels = [fmt.format(value) for fmt, value in zip(OVERVIEW_METRIC_FORMATS, values)]
+    color_classes = np.where(values >= 0, "text-success", "text-danger").tolist()
+    return labels, color_classes
+
+
+@ttl_cached(CACHE_TIMEOUT_SECONDS)
+def render_overview_cards():
+    """Build the overview card components from the cached summary."""
+    summary = get_portfolio_summary()
+    
+    if not summary:
+        return html.P("No portfolio data available", className="text-muted")
+    
+    # Create overview cards
+    cards = []
+    
+    # Total symbols
+    cards.append(
+        dbc.Card([
+            dbc.CardBody([
+                html.H3(f"{summary['total_symbols']}", className="text-primary"),
+                html.P("Symbols", className="mb-0")
             ])
-        ], width=12)
-    ], className="mb-4"),
+        ], className="text-center")
+    )
     
-    dbc.Row([
-        dbc.Col([
-            dbc.Tabs([
-                dbc.Tab(label="📊 Market Data", tab_id="market-tab"),
-                dbc.Tab(label="📈 Portfolio Performance", tab_id="portfolio-tab"),
-                dbc.Tab(label="⚠️ Risk Analysis", tab_id="risk-tab"),
-                dbc.Tab(label="🔗 Correlation Analysis", tab_id="correlation-tab"),
-                dbc.Tab(label="🔍 Stock Filtering", tab_id="stock-filtering-tab"),
-                dbc.Tab(label="💼 Portfolio Manager", tab_id="portfolio-manager-tab"),
-            ], id="tabs", active_tab="market-tab")
-        ])
-    ]),
+    # Total return, volatility and Sharpe ratio are formatted together
+    (total_return, volatility, sharpe_ratio), (return_class, _, sharpe_class) = format_overview_metrics(summary)
     
-    dbc.Row([
-        dbc.Col([
-            html.Div(id="tab-content")
-        ])
-    ], className="mt-4")
-], fluid=True)
+    # Total return
+    cards.append(
+        dbc.Card([
+            dbc.CardBody([
+                html.H3(total_return, className=return_class),
+                html.P("Total Return", className="mb-0")
+            ])
+        ], className="text-center")
+    )
+    
+    # Volatility
+    cards.append(
+        dbc.Card([
+            dbc.CardBody([
+                html.H3(volatility, className="text-warning"),
+                html.P("Volatility", className="mb-0")
+            ])
+        ], className="text-center")
+    )
+    
+    # Risk metrics
+    cards.append(
+        dbc.Card([
+            dbc.CardBody([
+                html.H3(sharpe_ratio, className=sharpe_class),
+                html.P("Sharpe Ratio", className="mb-0")
+            ])
+        ], className="text-center")
+    )
+    
+    return dbc.Row([dbc.Col(card, width=3) for card in cards])
 
 
 @app.callback(
     Output("portfolio-overview", "children"),
-    [Input("tabs", "active_tab")]
+    [Input("tabs", "value")]
 )
 def update_portfolio_overview(active_tab):
     """Update portfolio overview with real data."""
     try:
-        # Get portfolio summary
-        summary = data_service.get_portfolio_summary()
-        
-        if not summary:
-            return html.P("No portfolio data available", className="text-muted")
-        
-        # Create overview cards
-        cards = []
-        
-        # Total symbols
-        cards.append(
-            dbc.Card([
-                dbc.CardBody([
-                    html.H3(f"{summary['total_symbols']}", className="text-primary"),
-                    html.P("Symbols", className="mb-0")
-                ])
-            ], className="text-center")
-        )
-        
-        # Total return
-        total_return = summary.get('total_return', 0) * 100
-        cards.append(
-            dbc.Card([
-                dbc.CardBody([
-                    html.H3(f"{total_return:.2f}%", 
-                           className="text-success" if total_return >= 0 else "text-danger"),
-                    html.P("Total Return", className="mb-0")
-                ])
-            ], className="text-center")
-        )
-        
-        # Volatility
-        volatility = summary.get('volatility', 0) * 100
-        cards.append(
-            dbc.Card([
-                dbc.CardBody([
-                    html.H3(f"{volatility:.2f}%", className="text-warning"),
-                    html.P("Volatility", className="mb-0")
-                ])
-            ], className="text-center")
-        )
-        
-        # Risk metrics
-        risk_metrics = summary.get('risk_metrics', {})
-        sharpe_ratio = risk_metrics.get('sharpe_ratio', 0)
-        cards.append(
-            dbc.Card([
-                dbc.CardBody([
-                    html.H3(f"{sharpe_ratio:.3f}", 
-                           className="text-success" if sharpe_ratio >= 0 else "text-danger"),
-                    html.P("Sharpe Ratio", className="mb-0")
-                ])
-            ], className="text-center")
-        )
-        
-        return dbc.Row([dbc.Col(card, width=3) for card in cards])
+        # The summary is cached for CACHE_TIMEOUT_SECONDS, so the cards built
+        # from it are reused for the same window
+        return render_overview_cards()
         
     except Exception as e:
         logger.error(f"Error updating portfolio overview: {str(e)}")
         return html.P(f"Error loading data: {str(e)}", className="text-danger")
 
 
-@app.callback(
-    Output("tab-content", "children"),
-    [Input("tabs", "active_tab")]
-)
-def update_tab_content(active_tab):
-    """Update tab content based on active tab."""
-    if active_tab == "market-tab":
-        return create_market_data_tab()
-    elif active_tab == "portfolio-tab":
-        return create_portfolio_tab()
-    elif active_tab == "risk-tab":
-        return create_risk_tab()
-    elif active_tab == "correlation-tab":
-        return create_correlation_tab()
-    elif active_tab == "stock-filtering-tab":
-        return create_stock_filtering_tab()
-    elif active_tab == "portfolio-manager-tab":
-        return create_portfolio_manager_tab()
-    else:
-        return html.P("Select a tab to view content")
+# Tabs without runtime data are built once at import and shared by every page load
+MARKET_DATA_TAB = dbc.Row([
+    dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.H4("Stock Prices", className="card-title"),
+                dcc.Loading(dcc.Graph(id="stock-prices-chart"), type="graph")
+            ])
+        ])
+    ], width=12)
+])
 
 
-def create_market_data_tab():
-    """Create market data tab content."""
-    return dbc.Row([
+PORTFOLIO_TAB = dbc.Row([
+    dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.H4("Portfolio Performance", className="card-title"),
+                dcc.Loading(dcc.Graph(id="portfolio-performance-chart"), type="graph")
+            ])
+        ])
+    ], width=12)
+])
+
+
+RISK_TAB = html.Div([
+    dbc.Row([
         dbc.Col([
             dbc.Card([
                 dbc.CardBody([
-                    html.H4("Stock Prices", className="card-title"),
-                    dcc.Graph(id="stock-prices-chart")
+                    html.H4("Risk Metrics Over Time", className="card-title"),
+                    dcc.Loading(dcc.Graph(id="risk-metrics-chart"), type="graph")
                 ])
             ])
-        ], width=12)
-    ])
-
-
-def create_portfolio_tab():
-    """Create portfolio performance tab content."""
-    return dbc.Row([
+        ], width=6),
         dbc.Col([
             dbc.Card([
                 dbc.CardBody([
-                    html.H4("Portfolio Performance", className="card-title"),
-                    dcc.Graph(id="portfolio-performance-chart")
+                    html.H4("Risk Summary", className="card-title"),
+                    html.Div(id="risk-summary")
                 ])
             ])
-        ], width=12)
-    ])
-
-
-def create_risk_tab():
-    """Create risk analysis tab content."""
-    return html.Div([
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        html.H4("Risk Metrics Over Time", className="card-title"),
-                        dcc.Graph(id="risk-metrics-chart")
-                    ])
-                ])
-            ], width=6),
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        html.H4("Risk Summary", className="card-title"),
-                        html.Div(id="risk-summary")
-                    ])
-                ])
-            ], width=6)
-        ], className="mb-4"),
-        
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        html.H4("Value at Risk (VaR)", className="card-title"),
-                        dcc.Graph(id="var-chart")
-                    ])
-                ])
-            ], width=6),
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        html.H4("Drawdown Analysis", className="card-title"),
-                        dcc.Graph(id="drawdown-chart")
-                    ])
+        ], width=6)
+    ], className="mb-4"),
+    
+    dbc.Row([
+        dbc.Col([
+            dbc.Card([
+                dbc.CardBody([
+                    html.H4("Value at Risk (VaR)", className="card-title"),
+                    dcc.Loading(dcc.Graph(id="var-chart"), type="graph")
                 ])
-            ], width=6)
-        ])
-    ])
-
-
-def create_correlation_tab():
-    """Create correlation analysis tab content."""
-    return dbc.Row([
+            ])
+        ], width=6),
         dbc.Col([
             dbc.Card([
                 dbc.CardBody([
-                    html.H4("Asset Correlation Matrix", className="card-title"),
-                    dcc.Graph(id="correlation-matrix")
+                    html.H4("Drawdown Analysis", className="card-title"),
+                    dcc.Loading(dcc.Graph(id="drawdown-chart"), type="graph")
                 ])
             ])
-        ], width=12)
+        ], width=6)
     ])
+])
 
 
+CORRELATION_TAB = dbc.Row([
+    dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.H4("Asset Correlation Matrix", className="card-title"),
+                dcc.Loading(dcc.Graph(id="correlation-matrix"), type="graph")
+            ])
+        ])
+    ], width=12)
+])
+
+
+@ttl_cached(CACHE_TIMEOUT_SECONDS)
 def create_stock_filtering_tab():
     """Create stock filtering tab content."""
-    # Get available filter options
-    available_filters = stock_filtering_service.get_available_filters()
+    filter_options = get_filter_options()
     
     return dbc.Row([
         # Filter Controls
@@ -269,7 +444,7 @@ def create_stock_filtering_tab():
                             dbc.Label("Market Cap Categories"),
                             dcc.Dropdown(
                                 id="stock-market-cap-filter",
-                                options=[{"label": cat, "value": cat} for cat in available_filters.get('market_cap_categories', [])],
+                                options=filter_options['market_cap_categories'],
                                 multi=True,
                                 placeholder="Select market cap categories"
                             )
@@ -280,7 +455,7 @@ def create_stock_filtering_tab():
                             dbc.Label("Sectors"),
                             dcc.Dropdown(
                                 id="stock-sector-filter",
-                                options=[{"label": sector, "value": sector} for sector in available_filters.get('sectors', [])],
+                                options=filter_options['sectors'],
                                 multi=True,
                                 placeholder="Select sectors"
                             )
@@ -293,7 +468,7 @@ def create_stock_filtering_tab():
                             dbc.Label("Industries"),
                             dcc.Dropdown(
                                 id="stock-industry-filter",
-                                options=[{"label": industry, "value": industry} for industry in available_filters.get('industries', [])],
+                                options=filter_options['industries'],
                                 multi=True,
                                 placeholder="Select industries"
                             )
@@ -436,7 +611,7 @@ def create_stock_filtering_tab():
             dbc.Card([
                 dbc.CardHeader("Market Cap Distribution"),
                 dbc.CardBody([
-                    dcc.Graph(id="stock-market-cap-chart")
+                    dcc.Loading(dcc.Graph(id="stock-market-cap-chart"), type="circle")
                 ])
             ])
         ], width=6),
@@ -445,7 +620,7 @@ def create_stock_filtering_tab():
             dbc.Card([
                 dbc.CardHeader("Sector Distribution"),
                 dbc.CardBody([
-                    dcc.Graph(id="stock-sector-chart")
+                    dcc.Loading(dcc.Graph(id="stock-sector-chart"), type="circle")
                 ])
             ])
         ], width=6)
@@ -457,23 +632,20 @@ def create_stock_filtering_tab():
             dbc.Card([
                 dbc.CardHeader("Filtered Stocks"),
                 dbc.CardBody([
-                    html.Div(id="stock-results-table")
+                    dcc.Loading(html.Div(id="stock-results-table"), type="circle",
+                                parent_style={"minHeight": "400px"})
                 ])
             ])
         ], width=12)
     ]),
     
-    # Hidden div to store filtered data
-    html.Div(id="stock-filtered-data", style={"display": "none"})
+    # Store for the applied stock filters; the matching frame is cached server-side
+    dcc.Store(id="stock-filtered-data", storage_type="memory")
 
 
+@ttl_cached(CACHE_TIMEOUT_SECONDS)
 def create_portfolio_manager_tab():
     """Create portfolio management tab content."""
-    # Get available stocks for selection
-    available_stocks = stock_filtering_service.get_all_stocks()
-    stock_options = [{"label": f"{row['symbol']} - {row['name']}", "value": row['symbol']} 
-                     for _, row in available_stocks.iterrows()]
-    
     return [
         dbc.Row([
         # Portfolio Creation Section
@@ -522,7 +694,8 @@ def create_portfolio_manager_tab():
                                         dbc.Label("Stock Symbol"),
                                         dcc.Dropdown(
                                             id={"type": "stock-dropdown", "index": 0},
-                                            options=stock_options,
+                                            # Loaded when the tab is first opened
+                                            options=[],
                                             placeholder="Select stock"
                                         )
                                     ], width=6),
@@ -764,44 +937,33 @@ def create_portfolio_manager_tab():
         ])
     ], id="portfolio-details-modal", is_open=False, size="lg"),
     
-    # Hidden divs for data storage
-    html.Div(id="portfolio-data", style={"display": "none"}),
-    html.Div(id="analytics-data", style={"display": "none"}),
-    html.Div(id="selected-portfolio-id", style={"display": "none"}),
-    html.Div(id="stock-rows-count", children="1", style={"display": "none"})
+    # Client-side data stores
+    dcc.Store(id="portfolio-data", storage_type="memory"),
+    dcc.Store(id="analytics-data", storage_type="memory"),
+    dcc.Store(id="selected-portfolio-id", storage_type="memory"),
+    dcc.Store(id="selected-portfolio-data", storage_type="memory"),
+    dcc.Store(id="stock-rows-count", storage_type="memory", data=1)
 ]
 
 
-@app.callback(
-    Output("stock-prices-chart", "figure"),
-    [Input("tabs", "active_tab")]
-)
-def update_stock_prices_chart(active_tab):
+def update_stock_prices_chart():
     """Update stock prices chart with real data."""
-    if active_tab != "market-tab":
-        return go.Figure()
-    
     try:
         # Get stock prices data
-        stock_data = data_service.get_stock_prices()
+        stock_data = get_stock_prices()
         
         if stock_data.empty:
-            return go.Figure().add_annotation(
-                text="No stock data available",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
+            return message_figure("No stock data available")
         
         fig = go.Figure()
         
-        # Plot each symbol
-        for symbol in stock_data['symbol'].unique():
-            symbol_data = stock_data[stock_data['symbol'] == symbol].copy()
-            symbol_data = symbol_data.sort_values('date')
-            
-            fig.add_trace(go.Scatter(
-                x=symbol_data['date'],
-                y=symbol_data['close'],
+        # Sort only the plotted columns once and plot each symbol's contiguous slice
+        stock_data = stock_data[['symbol', 'date', 'close']].sort_values(['symbol', 'date'], kind='mergesort')
+        for symbol, symbol_data in stock_data.groupby('symbol', sort=False, observed=True):
+            dates, closes = downsample_xy(symbol_data['date'], symbol_data['close'])
+            fig.add_trace(go.Scattergl(
+                x=dates,
+                y=closes,
                 mode='lines',
                 name=symbol,
                 line=dict(width=2)
@@ -819,46 +981,31 @@ def update_stock_prices_chart(active_tab):
         
     except Exception as e:
         logger.error(f"Error updating stock prices chart: {str(e)}")
-        return go.Figure().add_annotation(
-            text=f"Error loading data: {str(e)}",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return message_figure(f"Error loading data: {str(e)}")
 
 
-@app.callback(
-    Output("portfolio-performance-chart", "figure"),
-    [Input("tabs", "active_tab")]
-)
-def update_portfolio_performance_chart(active_tab):
+def update_portfolio_performance_chart():
     """Update portfolio performance chart with real data."""
-    if active_tab != "portfolio-tab":
-        return go.Figure()
-    
     try:
         # Get portfolio performance data
-        portfolio_data = data_service.get_portfolio_performance()
+        portfolio_data = get_portfolio_performance()
         
         if portfolio_data.empty:
-            return go.Figure().add_annotation(
-                text="No portfolio data available",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
+            return message_figure("No portfolio data available")
         
         # Calculate cumulative returns
-        portfolio_data = portfolio_data.sort_values(['date', 'symbol'])
-        portfolio_data['cumulative_return'] = portfolio_data.groupby('symbol')['returns'].cumsum()
+        # Symbol-major order keeps each group's cumsum in date order without re-sorting
+        portfolio_data = portfolio_data.sort_values(['symbol', 'date'], kind='mergesort')
+        portfolio_data['cumulative_return'] = portfolio_data.groupby('symbol', sort=False, observed=True)['returns'].cumsum()
         
         fig = go.Figure()
         
         # Plot each symbol's cumulative returns
-        for symbol in portfolio_data['symbol'].unique():
-            symbol_data = portfolio_data[portfolio_data['symbol'] == symbol]
-            
-            fig.add_trace(go.Scatter(
-                x=symbol_data['date'],
-                y=symbol_data['cumulative_return'] * 100,  # Convert to percentage
+        for symbol, symbol_data in portfolio_data.groupby('symbol', sort=False, observed=True):
+            dates, cumulative_returns = downsample_xy(symbol_data['date'], symbol_data['cumulative_return'])
+            fig.add_trace(go.Scattergl(
+                x=dates,
+                y=cumulative_returns * 100,  # Convert to percentage
                 mode='lines',
                 name=symbol,
                 line=dict(width=2)
@@ -876,43 +1023,21 @@ def update_portfolio_performance_chart(active_tab):
         
     except Exception as e:
         logger.error(f"Error updating portfolio performance chart: {str(e)}")
-        return go.Figure().add_annotation(
-            text=f"Error loading data: {str(e)}",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return message_figure(f"Error loading data: {str(e)}")
 
 
-@app.callback(
-    Output("risk-metrics-chart", "figure"),
-    [Input("tabs", "active_tab")]
-)
-def update_risk_metrics_chart(active_tab):
-    """Update risk metrics chart with real data."""
-    if active_tab != "risk-tab":
-        return go.Figure()
-    
+def update_risk_metrics_chart(portfolio_returns):
+    """Build the rolling volatility chart from the daily portfolio returns."""
     try:
-        # Get portfolio performance data for volatility calculation
-        portfolio_data = data_service.get_portfolio_performance()
-        
-        if portfolio_data.empty:
-            return go.Figure().add_annotation(
-                text="No portfolio data available",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-        
         # Calculate rolling volatility (30-day window)
-        portfolio_data = portfolio_data.sort_values('date')
-        portfolio_returns = portfolio_data.groupby('date')['returns'].mean()  # Equal weight portfolio
-        rolling_vol = portfolio_returns.rolling(window=30).std() * np.sqrt(252)  # Annualized
+        rolling_vol = rolling_std(portfolio_returns.to_numpy(), 30) * np.sqrt(252)  # Annualized
         
         fig = go.Figure()
         
-        fig.add_trace(go.Scatter(
-            x=rolling_vol.index,
-            y=rolling_vol.values * 100,  # Convert to percentage
+        dates, volatility = downsample_xy(portfolio_returns.index, rolling_vol)
+        fig.add_trace(go.Scattergl(
+            x=dates,
+            y=volatility * 100,  # Convert to percentage
             mode='lines',
             name='30-Day Rolling Volatility',
             line=dict(color='red', width=2)
@@ -930,25 +1055,14 @@ def update_risk_metrics_chart(active_tab):
         
     except Exception as e:
         logger.error(f"Error updating risk metrics chart: {str(e)}")
-        return go.Figure().add_annotation(
-            text=f"Error loading data: {str(e)}",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return message_figure(f"Error loading data: {str(e)}")
 
 
-@app.callback(
-    Output("risk-summary", "children"),
-    [Input("tabs", "active_tab")]
-)
-def update_risk_summary(active_tab):
+def update_risk_summary():
     """Update risk summary with real data."""
-    if active_tab != "risk-tab":
-        return ""
-    
     try:
         # Get risk metrics
-        risk_metrics = data_service.get_risk_metrics()
+        risk_metrics = get_risk_metrics()
         
         if risk_metrics.empty:
             return html.P("No risk metrics available", className="text-muted")
@@ -976,30 +1090,11 @@ def update_risk_summary(active_tab):
         return html.P(f"Error loading data: {str(e)}", className="text-danger")
 
 
-@app.callback(
-    Output("var-chart", "figure"),
-    [Input("tabs", "active_tab")]
-)
-def update_var_chart(active_tab):
-    """Update VaR chart with real data."""
-    if active_tab != "risk-tab":
-        return go.Figure()
-    
+def update_var_chart(portfolio_returns):
+    """Build the VaR chart from the daily portfolio returns."""
     try:
-        # Get portfolio performance data
-        portfolio_data = data_service.get_portfolio_performance()
-        
-        if portfolio_data.empty:
-            return go.Figure().add_annotation(
-                text="No portfolio data available",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-        
-        # Calculate daily VaR
-        portfolio_returns = portfolio_data.groupby('date')['returns'].mean()
-        var_95 = np.percentile(portfolio_returns, 5)
-        var_99 = np.percentile(portfolio_returns, 1)
+        # Calculate daily VaR (both quantiles in one call)
+        var_95, var_99 = np.quantile(portfolio_returns.to_numpy(), [0.05, 0.01])
         
         fig = go.Figure()
         
@@ -1028,44 +1123,23 @@ def update_var_chart(active_tab):
         
     except Exception as e:
         logger.error(f"Error updating VaR chart: {str(e)}")
-        return go.Figure().add_annotation(
-            text=f"Error loading data: {str(e)}",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return message_figure(f"Error loading data: {str(e)}")
 
 
-@app.callback(
-    Output("drawdown-chart", "figure"),
-    [Input("tabs", "active_tab")]
-)
-def update_drawdown_chart(active_tab):
-    """Update drawdown chart with real data."""
-    if active_tab != "risk-tab":
-        return go.Figure()
-    
+def update_drawdown_chart(portfolio_returns):
+    """Build the drawdown chart from the daily portfolio returns."""
     try:
-        # Get portfolio performance data
-        portfolio_data = data_service.get_portfolio_performance()
-        
-        if portfolio_data.empty:
-            return go.Figure().add_annotation(
-                text="No portfolio data available",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-        
         # Calculate cumulative returns and drawdown
-        portfolio_returns = portfolio_data.groupby('date')['returns'].mean()
-        cumulative_returns = (1 + portfolio_returns).cumprod()
-        running_max = cumulative_returns.expanding().max()
-        drawdown = (cumulative_returns - running_max) / running_max
+        cumulative_returns = np.nancumprod(1 + portfolio_returns.to_numpy())
+        running_max = np.fmax.accumulate(cumulative_returns)
+        drawdown = cumulative_returns / running_max - 1
         
         fig = go.Figure()
         
-        fig.add_trace(go.Scatter(
-            x=drawdown.index,
-            y=drawdown.values * 100,  # Convert to percentage
+        dates, drawdown_values = downsample_xy(portfolio_returns.index, drawdown)
+        fig.add_trace(go.Scattergl(
+            x=dates,
+            y=drawdown_values * 100,  # Convert to percentage
             mode='lines',
             name='Drawdown',
             line=dict(color='red', width=2),
@@ -1084,43 +1158,56 @@ def update_drawdown_chart(active_tab):
         
     except Exception as e:
         logger.error(f"Error updating drawdown chart: {str(e)}")
-        return go.Figure().add_annotation(
-            text=f"Error loading data: {str(e)}",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return message_figure(f"Error loading data: {str(e)}")
 
 
-@app.callback(
-    Output("correlation-matrix", "figure"),
-    [Input("tabs", "active_tab")]
-)
-def update_correlation_matrix(active_tab):
-    """Update correlation matrix with real data."""
-    if active_tab != "correlation-tab":
-        return go.Figure()
+def update_risk_charts():
+    """Update the volatility, VaR and drawdown charts from one fetch of the portfolio returns."""
+    try:
+        portfolio_returns = get_portfolio_returns()
+    except Exception as e:
+        logger.error(f"Error loading portfolio returns: {str(e)}")
+        error_fig = message_figure(f"Error loading data: {str(e)}")
+        return error_fig, error_fig, error_fig
     
+    if portfolio_returns.empty:
+        empty_fig = message_figure("No portfolio data available")
+        return empty_fig, empty_fig, empty_fig
+    
+    return (update_risk_metrics_chart(portfolio_returns),
+            update_var_chart(portfolio_returns),
+            update_drawdown_chart(portfolio_returns))
+
+
+# Largest correlation matrix whose labels are drawn in the cells; larger
+# matrices show the same labels on hover
+HEATMAP_TEXT_MAX_ASSETS = 20
+
+
+def update_correlation_matrix():
+    """Update correlation matrix with real data."""
     try:
         # Get correlation matrix
-        correlation_matrix = data_service.get_correlation_matrix()
+        correlation_matrix = get_correlation_matrix()
         
         if correlation_matrix.empty:
-            return go.Figure().add_annotation(
-                text="No correlation data available",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
+            return message_figure("No correlation data available")
+        
+        # Cell labels are formatted once in NumPy and drawn in the cells while
+        # they stay legible; otherwise they are shown on hover only
+        values = correlation_matrix.to_numpy()
+        cell_text = dict(text=np.char.mod('%.3f', values))
+        if len(values) <= HEATMAP_TEXT_MAX_ASSETS:
+            cell_text.update(texttemplate="%{text}", textfont={"size": 10})
         
         fig = go.Figure(data=go.Heatmap(
-            z=correlation_matrix.values,
+            z=values,
             x=correlation_matrix.columns,
             y=correlation_matrix.index,
             colorscale='RdBu',
             zmid=0,
-            text=np.round(correlation_matrix.values, 3),
-            texttemplate="%{text}",
-            textfont={"size": 10},
-            hoverongaps=False
+            hoverongaps=False,
+            **cell_text
         ))
         
         fig.update_layout(
@@ -1134,19 +1221,46 @@ def update_correlation_matrix(active_tab):
         
     except Exception as e:
         logger.error(f"Error updating correlation matrix: {str(e)}")
-        return go.Figure().add_annotation(
-            text=f"Error loading data: {str(e)}",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return message_figure(f"Error loading data: {str(e)}")
+
+
+# (tab, outputs, builder) for every chart rendered from the active tab; a builder
+# with several outputs returns one value per output
+TAB_CHARTS = [
+    ("market-tab", [Output("stock-prices-chart", "figure")], update_stock_prices_chart),
+    ("portfolio-tab", [Output("portfolio-performance-chart", "figure")], update_portfolio_performance_chart),
+    ("risk-tab", [Output("risk-metrics-chart", "figure"),
+                  Output("var-chart", "figure"),
+                  Output("drawdown-chart", "figure")], update_risk_charts),
+    ("risk-tab", [Output("risk-summary", "children")], update_risk_summary),
+    ("correlation-tab", [Output("correlation-matrix", "figure")], update_correlation_matrix)
+]
+
+
+@app.callback(
+    [output for _, outputs, _ in TAB_CHARTS for output in outputs],
+    [Input("tabs", "value")]
+)
+def update_tab_charts(active_tab):
+    """Update every chart of the active tab in a single round-trip; other tabs' outputs are left untouched."""
+    values = []
+    for tab, outputs, builder in TAB_CHARTS:
+        if tab != active_tab:
+            values.extend([dash.no_update] * len(outputs))
+        elif len(outputs) == 1:
+            values.append(builder())
+        else:
+            values.extend(builder())
+    return values
 
 
 # Stock Filtering Callbacks
 @app.callback(
-    [Output("stock-filtered-data", "children"),
+    [Output("stock-filtered-data", "data"),
      Output("stock-filtered-count", "children"),
      Output("stock-avg-pe", "children"),
-     Output("stock-avg-dividend", "children")],
+     Output("stock-avg-dividend", "children"),
+     Output("stock-total-count", "children")],
     [Input("stock-apply-filters", "n_clicks")],
     [State("stock-market-cap-filter", "value"),
      State("stock-sector-filter", "value"),
@@ -1164,110 +1278,109 @@ def apply_stock_filters(n_clicks, market_cap, sectors, industries, price_min, pr
     
     if n_clicks is None:
         # Return all stocks on initial load
-        filtered_data = stock_filtering_service.get_all_stocks()
-    else:
-        # Build filter criteria
         filters = {}
-        
-        if market_cap:
-            filters['market_cap_categories'] = market_cap
-        if sectors:
-            filters['sectors'] = sectors
-        if industries:
-            filters['industries'] = industries
-        if price_min is not None:
-            filters['price_min'] = price_min
-        if price_max is not None:
-            filters['price_max'] = price_max
-        if pe_min is not None:
-            filters['pe_ratio_min'] = pe_min
-        if pe_max is not None:
-            filters['pe_ratio_max'] = pe_max
-        if div_min is not None:
-            filters['dividend_yield_min'] = div_min / 100  # Convert percentage to decimal
-        if div_max is not None:
-            filters['dividend_yield_max'] = div_max / 100
-        
-        # Apply filters
-        filtered_data = stock_filtering_service.get_stocks_by_filters(filters)
+    else:
+        # Build filter criteria from the inputs that are set
+        values = (market_cap, sectors, industries, price_min, price_max,
+                  pe_min, pe_max, div_min, div_max)
+        filters = {key: transform(value)
+                   for (key, transform), value in zip(STOCK_FILTER_SPEC, values)
+                   if value is not None and value != []}
+    
+    # Apply filters
+    filtered_data = get_filtered_stocks(filters)
     
     # Calculate summary metrics
     filtered_count = len(filtered_data)
-    avg_pe = filtered_data['pe_ratio'].mean() if not filtered_data.empty else 0
-    avg_dividend = filtered_data['dividend_yield'].mean() if not filtered_data.empty else 0
+    if filtered_data.empty:
+        avg_pe, avg_dividend = 0, 0
+    else:
+        avg_pe, avg_dividend = filtered_data[['pe_ratio', 'dividend_yield']].mean()
     
-    # Store filtered data as JSON
-    filtered_json = filtered_data.to_json(orient='records') if not filtered_data.empty else "[]"
+    # The unfiltered universe is already loaded (and cached) on the initial call
+    total_count = filtered_count if not filters else len(get_all_stocks())
     
-    return filtered_json, filtered_count, f"{avg_pe:.2f}", f"{avg_dividend:.4f}"
+    # Store only the filters; consumers read the cached frame back
+    return filters, filtered_count, f"{avg_pe:.2f}", f"{avg_dividend:.4f}", total_count
 
 
 @app.callback(
     [Output("stock-market-cap-chart", "figure"),
      Output("stock-sector-chart", "figure")],
-    [Input("stock-filtered-data", "children")]
+    [Input("stock-filtered-data", "data")]
 )
-def update_stock_charts(filtered_json):
+def update_stock_charts(filters):
     """Update stock charts based on filtered data."""
     
-    if not filtered_json or filtered_json == "[]":
+    if filters is None:
         # Return empty charts
-        empty_fig = go.Figure()
-        empty_fig.add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        empty_fig = message_figure("No data available")
         return empty_fig, empty_fig
     
     try:
-        from io import StringIO
-        filtered_data = pd.read_json(StringIO(filtered_json), orient='records')
+        filtered_data = get_filtered_stocks(filters)
+        
+        if filtered_data.empty:
+            empty_fig = message_figure("No data available")
+            return empty_fig, empty_fig
         
         # Market Cap Distribution
         cap_counts = filtered_data['market_cap_category'].value_counts()
-        cap_fig = px.pie(values=cap_counts.values, names=cap_counts.index, title="Market Cap Distribution")
+        cap_fig = go.Figure(go.Pie(labels=cap_counts.index, values=cap_counts.values))
+        cap_fig.update_layout(title="Market Cap Distribution")
         
         # Sector Distribution
         sector_counts = filtered_data['sector'].value_counts()
-        sector_fig = px.bar(x=sector_counts.index, y=sector_counts.values, title="Sector Distribution")
-        sector_fig.update_layout(xaxis_tickangle=45)
+        sector_fig = go.Figure(go.Bar(x=sector_counts.index, y=sector_counts.values))
+        sector_fig.update_layout(title="Sector Distribution", xaxis_tickangle=45)
         
         return cap_fig, sector_fig
         
     except Exception as e:
         logger.error(f"Error updating stock charts: {str(e)}")
-        empty_fig = go.Figure()
-        empty_fig.add_annotation(text="Error loading data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        empty_fig = message_figure("Error loading data")
         return empty_fig, empty_fig
 
 
+# Columns shown in the stock results table, and the float ones rounded for display
+STOCK_TABLE_COLUMNS = [
+    'symbol', 'name', 'sector', 'industry', 'market_cap_category',
+    'current_price', 'pe_ratio', 'dividend_yield', 'beta', 'volume'
+]
+STOCK_TABLE_FLOAT_COLUMNS = ['current_price', 'pe_ratio', 'dividend_yield', 'beta']
+
+
 @app.callback(
     Output("stock-results-table", "children"),
-    [Input("stock-filtered-data", "children")]
+    [Input("stock-filtered-data", "data")]
 )
-def update_stock_table(filtered_json):
+def update_stock_table(filters):
     """Update stock table based on filtered data."""
     
-    if not filtered_json or filtered_json == "[]":
+    if filters is None:
         return html.P("No stocks match the current filters.")
     
     try:
-        from io import StringIO
-        filtered_data = pd.read_json(StringIO(filtered_json), orient='records')
-        
-        # Select relevant columns for display
-        display_columns = [
-            'symbol', 'name', 'sector', 'industry', 'market_cap_category',
-            'current_price', 'pe_ratio', 'dividend_yield', 'beta', 'volume'
-        ]
-        
-        # Create table
-        table_data = filtered_data[display_columns].round(2)
-        
-        return dbc.Table.from_dataframe(
-            table_data,
-            striped=True,
-            bordered=True,
-            hover=True,
-            responsive=True,
-            size="sm"
+        filtered_data = get_filtered_stocks(filters)
+        
+        if filtered_data.empty:
+            return html.P("No stocks match the current filters.")
+        
+        # Select relevant columns for display, rounding only the float columns
+        table_data = filtered_data[STOCK_TABLE_COLUMNS]
+        table_data = table_data.assign(**table_data[STOCK_TABLE_FLOAT_COLUMNS].round(2))
+        
+        # Create table - virtualization keeps only the visible rows in the DOM
+        return dash_table.DataTable(
+            data=table_data.to_dict('records'),
+            columns=[{"name": col, "id": col} for col in STOCK_TABLE_COLUMNS],
+            virtualization=True,
+            fixed_rows={"headers": True},
+            page_action='none',
+            sort_action='native',
+            style_table={"height": "500px", "overflowY": "auto", "overflowX": "auto"},
+            style_cell={"textAlign": "left"},
+            style_header={"fontWeight": "bold"}
         )
         
     except Exception as e:
@@ -1294,68 +1407,65 @@ def clear_stock_filters(n_clicks):
     return [dash.no_update] * 9
 
 
-@app.callback(
-    Output("stock-total-count", "children"),
-    [Input("stock-filtered-data", "children")]
-)
-def update_stock_total_count(filtered_json):
-    """Update total stocks count."""
-    try:
-        all_stocks = stock_filtering_service.get_all_stocks()
-        return len(all_stocks)
-    except Exception as e:
-        logger.error(f"Error getting total stocks: {str(e)}")
-        return 0
+# Portfolio Management Callbacks
+def create_portfolio_card(portfolio):
+    """Create the card shown for a portfolio in the portfolio list."""
+    weights = ', '.join(f'{w:.1%}' for w in portfolio['weights'])
+    created = portfolio['created_at'][:10] if portfolio['created_at'] else 'N/A'
+    details = (f"Strategy: {portfolio['strategy']}\n"
+               f"Stocks: {', '.join(portfolio['symbols'])}\n"
+               f"Weights: {weights}\n"
+               f"Created: {created}")
+    
+    return dbc.Card([
+        dbc.CardBody([
+            html.H5(portfolio['name'], className="card-title"),
+            html.P(portfolio['description'], className="card-text"),
+            # One text node with line breaks instead of a Small/Br pair per line
+            html.Small(details, className="text-muted", style={"whiteSpace": "pre-line"}),
+            html.Div([
+                dbc.Button("View Details", 
+                          id={"type": "view-details-btn", "index": portfolio['id']}, 
+                          size="sm", color="info", className="me-1"),
+                dbc.Button("Delete", 
+                          id={"type": "delete-portfolio-btn", "index": portfolio['id']}, 
+                          size="sm", color="danger")
+            ], className="mt-2")
+        ])
+    ], className="mb-2")
+
+
+def create_portfolio_cards(portfolios):
+    """Create the portfolio list cards."""
+    return [create_portfolio_card(portfolio) for portfolio in portfolios]
+
+
+@ttl_cached(CACHE_TIMEOUT_SECONDS)
+def render_portfolio_cards():
+    """Render the portfolio list cards; call invalidate_portfolio_cards after any portfolio change."""
+    portfolios = portfolio_management_service.get_all_portfolios()
+    logger.info(f"Retrieved {len(portfolios)} portfolios from database")
+    return create_portfolio_cards(portfolios)
+
+
+def invalidate_portfolio_cards():
+    """Drop the cached portfolio list after a portfolio is created or deleted."""
+    render_portfolio_cards.cache_clear()
 
 
-# Portfolio Management Callbacks
 @app.callback(
     Output("portfolio-list", "children"),
-    [Input("create-portfolio-btn", "n_clicks"),
-     Input("tabs", "active_tab")],
-    prevent_initial_call=False
+    [Input("tabs", "value")],
+    # The list is only shown on the portfolio manager tab, never the default tab
+    prevent_initial_call=True
 )
-def update_portfolio_list(n_clicks, active_tab):
-    """Update portfolio list and dropdown options"""
-    logger.info(f"Update portfolio list called: n_clicks={n_clicks}, active_tab={active_tab}")
+def update_portfolio_list(active_tab):
+    """Update portfolio list"""
+    logger.info(f"Update portfolio list called: active_tab={active_tab}")
     
     if active_tab == "portfolio-manager-tab":
         try:
-            portfolios = portfolio_management_service.get_all_portfolios()
-            logger.info(f"Retrieved {len(portfolios)} portfolios from database")
-            
-            # Create portfolio list display
-            portfolio_cards = []
-            for portfolio in portfolios:
-                card = dbc.Card([
-                    dbc.CardBody([
-                        html.H5(portfolio['name'], className="card-title"),
-                        html.P(portfolio['description'], className="card-text"),
-                        html.Small(f"Strategy: {portfolio['strategy']}", className="text-muted"),
-                        html.Br(),
-                        html.Small(f"Stocks: {', '.join(portfolio['symbols'])}", className="text-muted"),
-                        html.Br(),
-                        html.Small(f"Weights: {', '.join([f'{w:.1%}' for w in portfolio['weights']])}", className="text-muted"),
-                        html.Br(),
-                        html.Small(f"Created: {portfolio['created_at'][:10] if portfolio['created_at'] else 'N/A'}", className="text-muted"),
-                        dbc.Row([
-                            dbc.Col([
-                                dbc.Button("View Details", 
-                                          id={"type": "view-details-btn", "index": portfolio['id']}, 
-                                          size="sm", color="info", className="me-1"),
-                                dbc.Button("Delete", 
-                                          id={"type": "delete-portfolio-btn", "index": portfolio['id']}, 
-                                          size="sm", color="danger")
-                            ], width=12)
-                        ], className="mt-2")
-                    ])
-                ], className="mb-2")
-                portfolio_cards.append(card)
-            
-            # Create dropdown options
-            portfolio_options = [{"label": p['name'], "value": p['id']} for p in portfolios]
-            
-            return portfolio_cards
+            return render_portfolio_cards()
             
         except Exception as e:
             logger.error(f"Error updating portfolio list: {str(e)}")
@@ -1365,77 +1475,74 @@ def update_portfolio_list(n_clicks, active_tab):
 
 
 # Dynamic Stock Form Callbacks
+@app.callback(
+    Output({"type": "stock-dropdown", "index": ALL}, "options"),
+    [Input("tabs", "value")],
+    [State({"type": "stock-dropdown", "index": ALL}, "options")],
+    prevent_initial_call=True
+)
+def load_stock_dropdown_options(active_tab, current_options):
+    """Load stock dropdown options the first time the portfolio manager tab is opened"""
+    if active_tab != "portfolio-manager-tab":
+        return [dash.no_update] * len(current_options)
+    
+    stock_options = get_stock_options()
+    return [dash.no_update if options else stock_options for options in current_options]
+
+
 @app.callback(
     [Output("stock-holdings-container", "children"),
-     Output("stock-rows-count", "children")],
-    [Input({"type": "add-stock-btn", "index": dash.dependencies.ALL}, "n_clicks")],
-    [State("stock-rows-count", "children"),
-     State({"type": "stock-dropdown", "index": dash.dependencies.ALL}, "value"),
-     State({"type": "weight-input", "index": dash.dependencies.ALL}, "value")],
+     Output("stock-rows-count", "data")],
+    [Input({"type": "add-stock-btn", "index": ALL}, "n_clicks")],
+    [State("stock-rows-count", "data")],
     prevent_initial_call=True
 )
-def add_stock_row(n_clicks_list, current_count, stock_values, weight_values):
-    """Add a new stock row when Add Stock button is clicked"""
+def add_stock_row(n_clicks_list, current_count):
+    """Append a new stock row when an Add Stock button is clicked"""
     if not any(n_clicks_list):
         return dash.no_update, dash.no_update
     
-    # Get available stocks for dropdown options
-    available_stocks = stock_filtering_service.get_all_stocks()
-    stock_options = [{"label": f"{row['symbol']} - {row['name']}", "value": row['symbol']} 
-                     for _, row in available_stocks.iterrows()]
-    
-    current_count = int(current_count)
-    new_count = current_count + 1
-    
-    # Create all rows preserving existing values
-    all_rows = []
-    for i in range(new_count + 1):
-        # Get existing values for this row
-        stock_value = stock_values[i] if i < len(stock_values) else None
-        weight_value = weight_values[i] if i < len(weight_values) else None
-        
-        row = dbc.Row([
-            dbc.Col([
-                dbc.Label("Stock Symbol"),
-                dcc.Dropdown(
-                    id={"type": "stock-dropdown", "index": i},
-                    options=stock_options,
-                    placeholder="Select stock",
-                    value=stock_value
-                )
-            ], width=6),
-            dbc.Col([
-                dbc.Label("Weight (%)"),
-                dbc.Input(
-                    id={"type": "weight-input", "index": i},
-                    type="number",
-                    placeholder="0",
-                    min=0,
-                    max=100,
-                    step=0.1,
-                    value=weight_value
-                )
-            ], width=4),
-            dbc.Col([
-                dbc.Label("Action"),
-                dbc.Button(
-                    "Add Stock",
-                    id={"type": "add-stock-btn", "index": i},
-                    color="success",
-                    size="sm",
-                    className="mt-3"
-                )
-            ], width=2)
-        ], className="mb-2", id={"type": "stock-row", "index": i})
-        
-        all_rows.append(row)
+    # Existing rows keep their values in the browser; only the new row is sent
+    row_index = int(current_count)
+    rows = Patch()
+    rows.append(dbc.Row([
+        dbc.Col([
+            dbc.Label("Stock Symbol"),
+            dcc.Dropdown(
+                id={"type": "stock-dropdown", "index": row_index},
+                options=get_stock_options(),
+                placeholder="Select stock"
+            )
+        ], width=6),
+        dbc.Col([
+            dbc.Label("Weight (%)"),
+            dbc.Input(
+                id={"type": "weight-input", "index": row_index},
+                type="number",
+                placeholder="0",
+                min=0,
+                max=100,
+                step=0.1
+            )
+        ], width=4),
+        dbc.Col([
+            dbc.Label("Action"),
+            dbc.Button(
+                "Add Stock",
+                id={"type": "add-stock-btn", "index": row_index},
+                color="success",
+                size="sm",
+                className="mt-3"
+            )
+        ], width=2)
+    ], className="mb-2", id={"type": "stock-row", "index": row_index}))
     
-    return all_rows, str(new_count)
+    return rows, row_index + 1
 
 
 @app.callback(
     Output("weight-summary", "children"),
-    [Input({"type": "weight-input", "index": dash.dependencies.ALL}, "value")],
+    [Input({"type": "weight-input", "index": ALL}, "value")],
     prevent_initial_call=False
 )
 def update_weight_summary(weight_values):
@@ -1443,11 +1550,9 @@ def update_weight_summary(weight_values):
     if not weight_values:
         return "Total Weight: 0%"
     
-    # Calculate total weight
-    total_weight = 0
-    for weight in weight_values:
-        if weight is not None:
-            total_weight += float(weight)
+    # Calculate total weight; empty inputs count as zero
+    total_weight = float(np.fromiter((weight or 0.0 for weight in weight_values),
+                                     dtype=np.float64, count=len(weight_values)).sum())
     
     # Determine color based on total
     if total_weight == 100:
@@ -1470,15 +1575,15 @@ def update_weight_summary(weight_values):
     [Output("portfolio-name", "value"),
      Output("portfolio-description", "value"),
      Output("stock-holdings-container", "children", allow_duplicate=True),
-     Output("stock-rows-count", "children", allow_duplicate=True),
+     Output("stock-rows-count", "data", allow_duplicate=True),
      Output("portfolio-list", "children", allow_duplicate=True),
      Output("portfolio-error-alert", "children")],
     [Input("create-portfolio-btn", "n_clicks")],
     [State("portfolio-name", "value"),
      State("portfolio-description", "value"),
      State("portfolio-strategy", "value"),
-     State({"type": "stock-dropdown", "index": dash.dependencies.ALL}, "value"),
-     State({"type": "weight-input", "index": dash.dependencies.ALL}, "value")],
+     State({"type": "stock-dropdown", "index": ALL}, "value"),
+     State({"type": "weight-input", "index": ALL}, "value")],
     prevent_initial_call=True
 )
 def create_portfolio_dynamic(n_clicks, name, description, strategy, stock_values, weight_values):
@@ -1487,25 +1592,20 @@ def create_portfolio_dynamic(n_clicks, name, description, strategy, stock_values
     
     if n_clicks and name and stock_values and weight_values:
         try:
-            # Filter out None values and create stock-weight pairs
-            stocks = []
-            weights = []
-            
-            for stock, weight in zip(stock_values, weight_values):
-                if stock is not None and weight is not None and weight > 0:
-                    stocks.append(stock)
-                    weights.append(float(weight) / 100)  # Convert percentage to decimal
+            # Keep rows with a stock and a positive weight; empty weights become NaN
+            weight_array = np.fromiter((np.nan if weight is None else weight for weight in weight_values),
+                                       dtype=np.float64, count=len(weight_values))
+            valid = (weight_array > 0) & np.fromiter((stock is not None for stock in stock_values),
+                                                     dtype=bool, count=len(stock_values))
+            stocks = [stock for stock, keep in zip(stock_values, valid) if keep]
             
             if not stocks:
                 logger.error("No valid stocks selected")
                 return dash.no_update, dash.no_update, dash.no_update, dash.no_update
             
-            # Normalize weights to ensure they sum to 1.0
-            total_weight = sum(weights)
-            if total_weight > 0:
-                weights = [w / total_weight for w in weights]
-            else:
-                weights = [1.0 / len(stocks)] * len(stocks)
+            # Normalize percentage weights to ensure they sum to 1.0
+            weight_array = weight_array[valid]
+            weights = (weight_array / weight_array.sum()).tolist()
             
             logger.info(f"Creating portfolio with stocks: {stocks}, weights: {weights}")
             
@@ -1521,9 +1621,7 @@ def create_portfolio_dynamic(n_clicks, name, description, strategy, stock_values
             logger.info(f"Successfully created portfolio: {portfolio['name']} with ID {portfolio['id']}")
             
             # Reset form
-            available_stocks = stock_filtering_service.get_all_stocks()
-            stock_options = [{"label": f"{row['symbol']} - {row['name']}", "value": row['symbol']} 
-                             for _, row in available_stocks.iterrows()]
+            stock_options = get_stock_options()
             
             # Reset to single row
             reset_rows = [dbc.Row([
@@ -1559,35 +1657,10 @@ def create_portfolio_dynamic(n_clicks, name, description, strategy, stock_values
             ], className="mb-2", id={"type": "stock-row", "index": 0})]
             
             # Update portfolio list
-            portfolios = portfolio_management_service.get_all_portfolios()
-            portfolio_cards = []
-            for portfolio in portfolios:
-                card = dbc.Card([
-                    dbc.CardBody([
-                        html.H5(portfolio['name'], className="card-title"),
-                        html.P(portfolio['description'], className="card-text"),
-                        html.Small(f"Strategy: {portfolio['strategy']}", className="text-muted"),
-                        html.Br(),
-                        html.Small(f"Stocks: {', '.join(portfolio['symbols'])}", className="text-muted"),
-                        html.Br(),
-                        html.Small(f"Weights: {', '.join([f'{w:.1%}' for w in portfolio['weights']])}", className="text-muted"),
-                        html.Br(),
-                        html.Small(f"Created: {portfolio['created_at'][:10] if portfolio['created_at'] else 'N/A'}", className="text-muted"),
-                        dbc.Row([
-                            dbc.Col([
-                                dbc.Button("View Details", 
-                                          id={"type": "view-details-btn", "index": portfolio['id']}, 
-                                          size="sm", color="info", className="me-1"),
-                                dbc.Button("Delete", 
-                                          id={"type": "delete-portfolio-btn", "index": portfolio['id']}, 
-                                          size="sm", color="danger")
-                            ], width=12)
-                        ], className="mt-2")
-                    ])
-                ], className="mb-2")
-                portfolio_cards.append(card)
+            invalidate_portfolio_cards()
+            portfolio_cards = render_portfolio_cards()
             
-            return "", "", reset_rows, "1", portfolio_cards, ""
+            return "", "", reset_rows, 1, portfolio_cards, ""
             
         except Exception as e:
             logger.error(f"Error creating portfolio: {str(e)}")
@@ -1605,90 +1678,40 @@ def create_portfolio_dynamic(n_clicks, name, description, strategy, stock_values
     return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update, ""
 
 
+# Portfolio fields sent to the clientside details renderer
+PORTFOLIO_DETAIL_FIELDS = ('name', 'description', 'strategy', 'created_at', 'updated_at', 'symbols', 'weights')
+
+
 # Portfolio Details Modal Callbacks
 @app.callback(
-    Output("portfolio-details-content", "children"),
+    Output("selected-portfolio-data", "data"),
     [Input("selected-portfolio-id", "data")],
     prevent_initial_call=True
 )
-def update_portfolio_details_content(selected_portfolio_id):
-    """Update portfolio details content when portfolio ID is selected"""
+def load_portfolio_details(selected_portfolio_id):
+    """Load the selected portfolio's details; the modal content is built clientside"""
     if selected_portfolio_id:
         try:
             portfolio = portfolio_management_service.get_portfolio(selected_portfolio_id)
             if portfolio:
-                # Create detailed content
-                content = [
-                    dbc.Row([
-                        dbc.Col([
-                            html.H4(portfolio['name'], className="mb-3"),
-                            html.P(portfolio['description'], className="text-muted mb-3")
-                        ], width=12)
-                    ]),
-                    
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Portfolio Information"),
-                                dbc.CardBody([
-                                    html.P(f"Strategy: {portfolio['strategy']}", className="mb-2"),
-                                    html.P(f"Created: {portfolio['created_at'][:10] if portfolio['created_at'] else 'N/A'}", className="mb-2"),
-                                    html.P(f"Last Updated: {portfolio['updated_at'][:10] if portfolio['updated_at'] else 'N/A'}", className="mb-0")
-                                ])
-                            ])
-                        ], width=6),
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Holdings Summary"),
-                                dbc.CardBody([
-                                    html.P(f"Number of Stocks: {len(portfolio['symbols'])}", className="mb-2"),
-                                    html.P(f"Total Weight: {sum(portfolio['weights']):.1%}", className="mb-0")
-                                ])
-                            ])
-                        ], width=6)
-                    ], className="mb-4"),
-                    
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Portfolio Holdings"),
-                                dbc.CardBody([
-                                    dbc.Table([
-                                        html.Thead([
-                                            html.Tr([
-                                                html.Th("Symbol"),
-                                                html.Th("Weight"),
-                                                html.Th("Allocation")
-                                            ])
-                                        ]),
-                                        html.Tbody([
-                                            html.Tr([
-                                                html.Td(symbol),
-                                                html.Td(f"{weight:.1%}"),
-                                                html.Td([
-                                                    dbc.Progress(
-                                                        value=weight*100,
-                                                        color="primary",
-                                                        className="mb-0",
-                                                        style={"height": "20px"}
-                                                    )
-                                                ])
-                                            ]) for symbol, weight in zip(portfolio['symbols'], portfolio['weights'])
-                                        ])
-                                    ], striped=True, bordered=True, hover=True)
-                                ])
-                            ])
-                        ], width=12)
-                    ])
-                ]
-                return True, content
+                details = {key: portfolio[key] for key in PORTFOLIO_DETAIL_FIELDS}
+                details['total_weight'] = math.fsum(portfolio['weights'])
+                return details
             else:
-                return False, "Portfolio not found"
+                return {"error": "Portfolio not found"}
         except Exception as e:
             logger.error(f"Error getting portfolio details: {str(e)}")
-            return False, f"Error loading portfolio: {str(e)}"
+            return {"error": f"Error loading portfolio: {str(e)}"}
     
-    return ""
+    return None
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="portfolio", function_name="renderDetails"),
+    Output("portfolio-details-content", "children"),
+    [Input("selected-portfolio-data", "data")],
+    prevent_initial_call=True
+)
 
 
 # Separate callback for close button
@@ -1709,7 +1732,7 @@ def close_portfolio_modal(close_clicks):
 @app.callback(
     [Output("selected-portfolio-id", "data"),
      Output("portfolio-details-modal", "is_open", allow_duplicate=True)],
-    [Input({"type": "view-details-btn", "index": dash.dependencies.ALL}, "n_clicks")],
+    [Input({"type": "view-details-btn", "index": ALL}, "n_clicks")],
     prevent_initial_call=True
 )
 def handle_view_details_click(view_clicks):
@@ -1722,32 +1745,24 @@ def handle_view_details_click(view_clicks):
     trigger_id = ctx.triggered[0]["prop_id"]
     
     if "view-details-btn" in trigger_id:
-        # Extract portfolio ID from the trigger using a more robust method
-        trigger_data = ctx.triggered[0]["prop_id"].split(".")[0]
-        # Parse the JSON-like structure to extract the index
+        # The component id before the property name is the JSON-encoded
+        # pattern-matching id, e.g. {"index":22,"type":"view-details-btn"}
+        trigger_data = trigger_id.rsplit(".", 1)[0]
         try:
-            # The trigger_data looks like: {"type":"view-details-btn","index":22}
-            portfolio_id = int(trigger_data.split('"index":')[1].split(',')[0].split('}')[0])
-            logger.info(f"View details clicked for portfolio ID: {portfolio_id}")
-            return portfolio_id, True  # Return portfolio ID and open modal
-        except (IndexError, ValueError):
-            # Fallback: try to extract number from the string
-            import re
-            numbers = re.findall(r'\d+', trigger_data)
-            if numbers:
-                portfolio_id = int(numbers[-1])  # Take the last number found
-                logger.info(f"View details clicked for portfolio ID (fallback): {portfolio_id}")
-                return portfolio_id, True  # Return portfolio ID and open modal
-            else:
-                logger.error(f"Could not extract portfolio ID from trigger: {trigger_data}")
-                return dash.no_update, dash.no_update
+            portfolio_id = json.loads(trigger_data)["index"]
+        except (ValueError, KeyError):
+            logger.error(f"Could not extract portfolio ID from trigger: {trigger_data}")
+            return dash.no_update, dash.no_update
+        
+        logger.info(f"View details clicked for portfolio ID: {portfolio_id}")
+        return portfolio_id, True  # Return portfolio ID and open modal
     
     return dash.no_update, dash.no_update
 
 
 @app.callback(
     Output("portfolio-list", "children", allow_duplicate=True),
-    [Input({"type": "delete-portfolio-btn", "index": dash.dependencies.ALL}, "n_clicks")],
+    [Input({"type": "delete-portfolio-btn", "index": ALL}, "n_clicks")],
     prevent_initial_call=True
 )
 def delete_portfolio(delete_clicks):
@@ -1760,21 +1775,14 @@ def delete_portfolio(delete_clicks):
     trigger_id = ctx.triggered[0]["prop_id"]
     
     if "delete-portfolio-btn" in trigger_id:
-        # Extract portfolio ID from the trigger using a more robust method
-        trigger_data = ctx.triggered[0]["prop_id"].split(".")[0]
-        # Parse the JSON-like structure to extract the index
+        # The component id before the property name is the JSON-encoded
+        # pattern-matching id, e.g. {"index":22,"type":"delete-portfolio-btn"}
+        trigger_data = trigger_id.rsplit(".", 1)[0]
         try:
-            # The trigger_data looks like: {"type":"delete-portfolio-btn","index":22}
-            portfolio_id = int(trigger_data.split('"index":')[1].split(',')[0].split('}')[0])
-        except (IndexError, ValueError):
-            # Fallback: try to extract number from the string
-            import re
-            numbers = re.findall(r'\d+', trigger_data)
-            if numbers:
-                portfolio_id = int(numbers[-1])  # Take the last number found
-            else:
-                logger.error(f"Could not extract portfolio ID from trigger: {trigger_data}")
-                return dash.no_update
+            portfolio_id = json.loads(trigger_data)["index"]
+        except (ValueError, KeyError):
+            logger.error(f"Could not extract portfolio ID from trigger: {trigger_data}")
+            return dash.no_update
         
         try:
             # Delete portfolio
@@ -1782,33 +1790,8 @@ def delete_portfolio(delete_clicks):
             logger.info(f"Deleted portfolio with ID {portfolio_id}")
             
             # Refresh portfolio list
-            portfolios = portfolio_management_service.get_all_portfolios()
-            portfolio_cards = []
-            for portfolio in portfolios:
-                card = dbc.Card([
-                    dbc.CardBody([
-                        html.H5(portfolio['name'], className="card-title"),
-                        html.P(portfolio['description'], className="card-text"),
-                        html.Small(f"Strategy: {portfolio['strategy']}", className="text-muted"),
-                        html.Br(),
-                        html.Small(f"Stocks: {', '.join(portfolio['symbols'])}", className="text-muted"),
-                        html.Br(),
-                        html.Small(f"Weights: {', '.join([f'{w:.1%}' for w in portfolio['weights']])}", className="text-muted"),
-                        html.Br(),
-                        html.Small(f"Created: {portfolio['created_at'][:10] if portfolio['created_at'] else 'N/A'}", className="text-muted"),
-                        dbc.Row([
-                            dbc.Col([
-                                dbc.Button("View Details", 
-                                          id={"type": "view-details-btn", "index": portfolio['id']}, 
-                                          size="sm", color="info", className="me-1"),
-                                dbc.Button("Delete", 
-                                          id={"type": "delete-portfolio-btn", "index": portfolio['id']}, 
-                                          size="sm", color="danger")
-                            ], width=12)
-                        ], className="mt-2")
-                    ])
-                ], className="mb-2")
-                portfolio_cards.append(card)
+            invalidate_portfolio_cards()
+            portfolio_cards = render_portfolio_cards()
             
             return portfolio_cards
             
@@ -1819,6 +1802,17 @@ def delete_portfolio(delete_clicks):
     return dash.no_update
 
 
+# Analytics run as a background callback, with the button disabled meanwhile,
+# whenever a background callback manager is available
+ANALYTICS_CALLBACK_OPTIONS = {}
+if background_callback_manager is not None:
+    ANALYTICS_CALLBACK_OPTIONS = dict(
+        background=True,
+        manager=background_callback_manager,
+        running=[(Output("calculate-analytics-btn", "disabled"), True, False)]
+    )
+
+
 @app.callback(
     [Output("total-return-metric", "children"),
      Output("annualized-return-metric", "children"),
@@ -1828,10 +1822,12 @@ def delete_portfolio(delete_clicks):
      Output("var-95-metric", "children"),
      Output("cvar-95-metric", "children"),
      Output("diversification-ratio-metric", "children"),
-     Output("analytics-data", "children")],
+     Output("analytics-data", "data")],
     [Input("calculate-analytics-btn", "n_clicks")],
     [State("analytics-portfolio-select", "value"),
-     State("analytics-period", "value")]
+     State("analytics-period", "value")],
+    prevent_initial_call=True,
+    **ANALYTICS_CALLBACK_OPTIONS
 )
 def calculate_portfolio_analytics(n_clicks, portfolio_id, period):
     """Calculate portfolio analytics"""
@@ -1839,7 +1835,7 @@ def calculate_portfolio_analytics(n_clicks, portfolio_id, period):
         try:
             portfolio = portfolio_management_service.get_portfolio(portfolio_id)
             if not portfolio:
-                return ["N/A"] * 8 + ["{}"]
+                return ["N/A"] * 8 + [{}]
             
             # Calculate analytics
             analytics = portfolio_management_service.calculate_portfolio_analytics(
@@ -1847,7 +1843,7 @@ def calculate_portfolio_analytics(n_clicks, portfolio_id, period):
             )
             
             if "error" in analytics:
-                return ["Error"] * 8 + [json.dumps(analytics)]
+                return ["Error"] * 8 + [analytics]
             
             # Format metrics
             total_return = f"{analytics.get('total_return', 0) * 100:.2f}%"
@@ -1860,54 +1856,34 @@ def calculate_portfolio_analytics(n_clicks, portfolio_id, period):
             diversification = f"{analytics.get('diversification_ratio', 0):.3f}"
             
             return [total_return, annualized_return, sharpe_ratio, max_drawdown, 
-                   volatility, var_95, cvar_95, diversification, json.dumps(analytics)]
+                   volatility, var_95, cvar_95, diversification, analytics]
             
         except Exception as e:
             logger.error(f"Error calculating analytics: {str(e)}")
-            return ["Error"] * 8 + [json.dumps({"error": str(e)})]
+            return ["Error"] * 8 + [{"error": str(e)}]
     
-    return ["N/A"] * 8 + ["{}"]
+    return ["N/A"] * 8 + [{}]
 
 
-@app.callback(
+# The analytics charts only depend on the store contents, so they are built in
+# the browser instead of sending the analytics back to the server
+app.clientside_callback(
+    ClientsideFunction(namespace="portfolio", function_name="analyticsCharts"),
     [Output("portfolio-performance-chart-manager", "figure"),
      Output("portfolio-drawdown-chart", "figure")],
-    [Input("analytics-data", "children")]
+    [Input("analytics-data", "data")],
+    prevent_initial_call=True
+)
+
+
+# (column, analytics key, format, scale) for each metric in the comparison table
+COMPARISON_METRICS = (
+    ('Total Return', 'total_return', '%.2f%%', 100),
+    ('Annualized Return', 'annualized_return', '%.2f%%', 100),
+    ('Sharpe Ratio', 'sharpe_ratio', '%.3f', 1),
+    ('Max Drawdown', 'max_drawdown', '%.2f%%', 100),
+    ('Volatility', 'portfolio_volatility', '%.2f%%', 100),
 )
-def update_portfolio_charts(analytics_json):
-    """Update portfolio performance and drawdown charts"""
-    if not analytics_json or analytics_json == "{}":
-        empty_fig = go.Figure()
-        empty_fig.add_annotation(text="No analytics data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        return empty_fig, empty_fig
-    
-    try:
-        analytics = json.loads(analytics_json)
-        
-        if "error" in analytics:
-            empty_fig = go.Figure()
-            empty_fig.add_annotation(text=f"Error: {analytics['error']}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-            return empty_fig, empty_fig
-        
-        # Create performance chart (placeholder - would need actual time series data)
-        performance_fig = go.Figure()
-        performance_fig.add_annotation(text="Performance chart would show portfolio value over time", 
-                                     xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        performance_fig.update_layout(title="Portfolio Performance", showlegend=False)
-        
-        # Create drawdown chart (placeholder)
-        drawdown_fig = go.Figure()
-        drawdown_fig.add_annotation(text="Drawdown chart would show portfolio drawdowns over time", 
-                                  xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        drawdown_fig.update_layout(title="Portfolio Drawdown", showlegend=False)
-        
-        return performance_fig, drawdown_fig
-        
-    except Exception as e:
-        logger.error(f"Error updating portfolio charts: {str(e)}")
-        empty_fig = go.Figure()
-        empty_fig.add_annotation(text="Error loading charts", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        return empty_fig, empty_fig
 
 
 @app.callback(
@@ -1924,21 +1900,18 @@ def compare_portfolios(n_clicks, portfolio_ids):
             if "error" in comparison:
                 return html.P(f"Error: {comparison['error']}")
             
-            # Create comparison table
-            comparison_data = []
-            for portfolio in comparison['portfolios']:
-                analytics = portfolio.get('analytics', {})
-                comparison_data.append({
-                    'Portfolio': portfolio['name'],
-                    'Strategy': portfolio['strategy'],
-                    'Total Return': f"{analytics.get('total_return', 0) * 100:.2f}%",
-                    'Annualized Return': f"{analytics.get('annualized_return', 0) * 100:.2f}%",
-                    'Sharpe Ratio': f"{analytics.get('sharpe_ratio', 0):.3f}",
-                    'Max Drawdown': f"{analytics.get('max_drawdown', 0) * 100:.2f}%",
-                    'Volatility': f"{analytics.get('portfolio_volatility', 0) * 100:.2f}%"
-                })
+            # Create comparison table one column at a time
+            portfolios = comparison['portfolios']
+            analytics = [portfolio.get('analytics', {}) for portfolio in portfolios]
+            columns = {
+                'Portfolio': [portfolio['name'] for portfolio in portfolios],
+                'Strategy': [portfolio['strategy'] for portfolio in portfolios],
+            }
+            for column, key, fmt, scale in COMPARISON_METRICS:
+                values = np.array([a.get(key, 0) for a in analytics], dtype=np.float64) * scale
+                columns[column] = np.char.mod(fmt, values)
             
-            comparison_df = pd.DataFrame(comparison_data)
+            comparison_df = pd.DataFrame(columns, copy=False)
             
             return dbc.Table.from_dataframe(
                 comparison_df,
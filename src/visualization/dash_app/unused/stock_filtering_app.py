@@ -3,12 +3,13 @@ Stock Filtering Dashboard Application
 """
 
 import dash
-from dash import dcc, html, Input, Output, State, callback_context
+from dash import dcc, html, dash_table, Input, Output, State, ClientsideFunction, callback_context
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
-import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import json
+from functools import lru_cache
 from typing import Dict, List, Any
 import sys
 import os
@@ -29,12 +30,62 @@ app.title = "Stock Filtering Dashboard"
 # Initialize the stock filtering service
 stock_service = StockFilteringService()
 
+@lru_cache(maxsize=1)
+def _cached_available_filters() -> Dict[str, Any]:
+    """Available filter options, fetched once per process"""
+    return stock_service.get_available_filters()
+
+# Dropdown options are built once at import rather than on every layout build
+_AVAILABLE_FILTERS = _cached_available_filters()
+MARKET_CAP_OPTIONS = [{"label": cat, "value": cat} for cat in _AVAILABLE_FILTERS.get('market_cap_categories', [])]
+SECTOR_OPTIONS = [{"label": sector, "value": sector} for sector in _AVAILABLE_FILTERS.get('sectors', [])]
+# Industries can number in the thousands, so their options are served on search
+_ALL_INDUSTRIES = _AVAILABLE_FILTERS.get('industries', [])
+INDUSTRY_SEARCH_LIMIT = 50
+
+def _chart_counts(values: pd.Series) -> Dict[str, List]:
+    """Category counts in the chart-data layout, most common first"""
+    counts = values.value_counts()
+    return {"names": [str(name) for name in counts.index], "counts": counts.tolist()}
+
+def _build_initial_payload(all_stocks: pd.DataFrame) -> Dict[str, Any]:
+    """Build the all-stocks store payload along with its unfiltered summary"""
+    if all_stocks.empty:
+        return {
+            "columns": [], "data": [],
+            "initial": {
+                "chart_data": {"market_cap": {"names": [], "counts": []},
+                               "sector": {"names": [], "counts": []}},
+                "count": 0, "avg_pe": f"{0:.2f}", "avg_dividend": f"{0:.4f}"
+            }
+        }
+    
+    # Split layout sends column names once instead of on every row
+    payload = all_stocks.to_dict('split', index=False)
+    payload["initial"] = {
+        "chart_data": {
+            "market_cap": _chart_counts(all_stocks['market_cap_category']),
+            "sector": _chart_counts(all_stocks['sector'])
+        },
+        "count": len(all_stocks),
+        "avg_pe": f"{all_stocks['pe_ratio'].mean():.2f}",
+        "avg_dividend": f"{all_stocks['dividend_yield'].mean():.4f}"
+    }
+    return payload
+
+# The stock universe does not change during a session, so load it and its
+# unfiltered summary once at import rather than on every page load
+try:
+    _INITIAL_DF = stock_service.get_all_stocks()
+except Exception as e:
+    logger.error(f"Error getting all stocks: {str(e)}")
+    _INITIAL_DF = pd.DataFrame()
+ALL_STOCKS_PAYLOAD = _build_initial_payload(_INITIAL_DF)
+TOTAL_STOCKS = len(_INITIAL_DF)
+
 def create_filter_controls():
     """Create filter control components"""
     
-    # Get available filter options
-    available_filters = stock_service.get_available_filters()
-    
     return dbc.Card([
         dbc.CardHeader("Stock Filters"),
         dbc.CardBody([
@@ -44,7 +95,7 @@ def create_filter_controls():
                     dbc.Label("Market Cap Categories"),
                     dcc.Dropdown(
                         id="market-cap-filter",
-                        options=[{"label": cat, "value": cat} for cat in available_filters.get('market_cap_categories', [])],
+                        options=MARKET_CAP_OPTIONS,
                         multi=True,
                         placeholder="Select market cap categories"
                     )
@@ -55,7 +106,7 @@ def create_filter_controls():
                     dbc.Label("Sectors"),
                     dcc.Dropdown(
                         id="sector-filter",
-                        options=[{"label": sector, "value": sector} for sector in available_filters.get('sectors', [])],
+                        options=SECTOR_OPTIONS,
                         multi=True,
                         placeholder="Select sectors"
                     )
@@ -68,9 +119,9 @@ def create_filter_controls():
                     dbc.Label("Industries"),
                     dcc.Dropdown(
                         id="industry-filter",
-                        options=[{"label": industry, "value": industry} for industry in available_filters.get('industries', [])],
+                        options=[],
                         multi=True,
-                        placeholder="Select industries"
+                        placeholder="Type to search industries"
                     )
                 ], width=6),
                 
@@ -229,7 +280,7 @@ def create_summary_cards():
         dbc.Col([
             dbc.Card([
                 dbc.CardBody([
-                    html.H4(id="total-stocks", className="card-title"),
+                    html.H4(TOTAL_STOCKS, id="total-stocks", className="card-title"),
                     html.P("Total Stocks", className="card-text")
                 ])
             ])
@@ -314,18 +365,24 @@ app.layout = dbc.Container([
     # Stock Table
     create_stock_table(),
     
-    # Hidden div to store filtered data
-    html.Div(id="filtered-data", style={"display": "none"})
+    # Stores for the full stock universe and the filtered subset
+    dcc.Store(id="all-stocks", storage_type="memory", data=ALL_STOCKS_PAYLOAD),
+    dcc.Store(id="filtered-data"),
+    dcc.Store(id="chart-data")
     
 ], fluid=True)
 
 # Callbacks
-@app.callback(
-    [Output("filtered-data", "children"),
+# Filters are applied in the browser (assets/stock_filters.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="stock_filters", function_name="apply"),
+    [Output("filtered-data", "data"),
+     Output("chart-data", "data"),
      Output("filtered-stocks", "children"),
      Output("avg-pe", "children"),
      Output("avg-dividend", "children")],
-    [Input("apply-filters", "n_clicks")],
+    [Input("apply-filters", "n_clicks"),
+     Input("all-stocks", "data")],
     [State("market-cap-filter", "value"),
      State("sector-filter", "value"),
      State("industry-filter", "value"),
@@ -341,85 +398,33 @@ app.layout = dbc.Container([
      State("beta-max", "value"),
      State("volume-min", "value")]
 )
-def apply_filters(n_clicks, market_cap, sectors, industries, price_min, price_max,
-                 pe_min, pe_max, peg_min, peg_max, div_min, div_max, beta_min, beta_max, volume_min):
-    """Apply filters and return filtered data"""
-    
-    if n_clicks is None:
-        # Return all stocks on initial load
-        filtered_data = stock_service.get_all_stocks()
-    else:
-        # Build filter criteria
-        filters = {}
-        
-        if market_cap:
-            filters['market_cap_categories'] = market_cap
-        if sectors:
-            filters['sectors'] = sectors
-        if industries:
-            filters['industries'] = industries
-        if price_min is not None:
-            filters['price_min'] = price_min
-        if price_max is not None:
-            filters['price_max'] = price_max
-        if pe_min is not None:
-            filters['pe_ratio_min'] = pe_min
-        if pe_max is not None:
-            filters['pe_ratio_max'] = pe_max
-        if peg_min is not None:
-            filters['peg_ratio_min'] = peg_min
-        if peg_max is not None:
-            filters['peg_ratio_max'] = peg_max
-        if div_min is not None:
-            filters['dividend_yield_min'] = div_min / 100  # Convert percentage to decimal
-        if div_max is not None:
-            filters['dividend_yield_max'] = div_max / 100
-        if beta_min is not None:
-            filters['beta_min'] = beta_min
-        if beta_max is not None:
-            filters['beta_max'] = beta_max
-        if volume_min is not None:
-            filters['volume_min'] = volume_min
-        
-        # Apply filters
-        filtered_data = stock_service.get_stocks_by_filters(filters)
-    
-    # Calculate summary metrics
-    filtered_count = len(filtered_data)
-    avg_pe = filtered_data['pe_ratio'].mean() if not filtered_data.empty else 0
-    avg_dividend = filtered_data['dividend_yield'].mean() if not filtered_data.empty else 0
-    
-    # Store filtered data as JSON
-    filtered_json = filtered_data.to_json(orient='records') if not filtered_data.empty else "[]"
-    
-    return filtered_json, filtered_count, f"{avg_pe:.2f}", f"{avg_dividend:.4f}"
 
 @app.callback(
     [Output("market-cap-chart", "figure"),
      Output("sector-chart", "figure")],
-    [Input("filtered-data", "children")]
+    [Input("chart-data", "data")],
+    # Rendered once the clientside apply callback fills the store on load
+    prevent_initial_call=True
 )
-def update_charts(filtered_json):
-    """Update charts based on filtered data"""
+def update_charts(chart_data):
+    """Update charts from the category counts computed with the filters"""
     
-    if not filtered_json or filtered_json == "[]":
+    if not chart_data or not chart_data['market_cap']['names']:
         # Return empty charts
         empty_fig = go.Figure()
         empty_fig.add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         return empty_fig, empty_fig
     
     try:
-        from io import StringIO
-        filtered_data = pd.read_json(StringIO(filtered_json), orient='records')
-        
         # Market Cap Distribution
-        cap_counts = filtered_data['market_cap_category'].value_counts()
-        cap_fig = px.pie(values=cap_counts.values, names=cap_counts.index, title="Market Cap Distribution")
+        cap_counts = chart_data['market_cap']
+        cap_fig = go.Figure(go.Pie(labels=cap_counts['names'], values=cap_counts['counts']))
+        cap_fig.update_layout(title="Market Cap Distribution")
         
         # Sector Distribution
-        sector_counts = filtered_data['sector'].value_counts()
-        sector_fig = px.bar(x=sector_counts.index, y=sector_counts.values, title="Sector Distribution")
-        sector_fig.update_layout(xaxis_tickangle=45)
+        sector_counts = chart_data['sector']
+        sector_fig = go.Figure(go.Bar(x=sector_counts['names'], y=sector_counts['counts']))
+        sector_fig.update_layout(title="Sector Distribution", xaxis_tickangle=45)
         
         return cap_fig, sector_fig
         
@@ -431,17 +436,18 @@ def update_charts(filtered_json):
 
 @app.callback(
     Output("stock-table", "children"),
-    [Input("filtered-data", "children")]
+    [Input("filtered-data", "data")],
+    # Rendered once the clientside apply callback fills the store on load
+    prevent_initial_call=True
 )
-def update_stock_table(filtered_json):
+def update_stock_table(filtered_split):
     """Update stock table based on filtered data"""
     
-    if not filtered_json or filtered_json == "[]":
+    if not filtered_split or not filtered_split['data']:
         return html.P("No stocks match the current filters.")
     
     try:
-        from io import StringIO
-        filtered_data = pd.read_json(StringIO(filtered_json), orient='records')
+        filtered_data = pd.DataFrame.from_records(filtered_split['data'], columns=filtered_split['columns'])
         
         # Select relevant columns for display
         display_columns = [
@@ -449,22 +455,47 @@ def update_stock_table(filtered_json):
             'current_price', 'pe_ratio', 'dividend_yield', 'beta', 'volume'
         ]
         
-        # Create table
-        table_data = filtered_data[display_columns].round(2)
+        # Round while emitting records rather than copying the frame with round(2)
+        records = filtered_data[display_columns].to_dict('records')
+        for record in records:
+            for column in ('current_price', 'pe_ratio', 'dividend_yield', 'beta'):
+                value = record.get(column)
+                record[column] = round(value, 2) if isinstance(value, float) else value
         
-        return dbc.Table.from_dataframe(
-            table_data,
-            striped=True,
-            bordered=True,
-            hover=True,
-            responsive=True,
-            size="sm"
+        # Create table - sorting and filtering run in the browser, and
+        # virtualization keeps only the visible rows in the DOM
+        return dash_table.DataTable(
+            data=records,
+            columns=[{"name": col, "id": col} for col in display_columns],
+            virtualization=True,
+            fixed_rows={"headers": True},
+            page_action='none',
+            sort_action='native',
+            filter_action='native',
+            style_table={"height": "500px", "overflowY": "auto", "overflowX": "auto"},
+            style_cell={"textAlign": "left"},
+            style_header={"fontWeight": "bold"}
         )
         
     except Exception as e:
         logger.error(f"Error updating stock table: {str(e)}")
         return html.P("Error loading stock data.")
 
+@app.callback(
+    Output("industry-filter", "options"),
+    [Input("industry-filter", "search_value")],
+    [State("industry-filter", "value")]
+)
+def update_industry_options(search_value, selected_industries):
+    """Send only the industries matching the search text, keeping current selections"""
+    if not search_value:
+        raise PreventUpdate
+    
+    search = search_value.lower()
+    matches = [industry for industry in _ALL_INDUSTRIES if search in industry.lower()][:INDUSTRY_SEARCH_LIMIT]
+    return [{"label": industry, "value": industry}
+            for industry in dict.fromkeys((selected_industries or []) + matches)]
+
 @app.callback(
     [Output("market-cap-filter", "value"),
      Output("sector-filter", "value"),
@@ -488,19 +519,6 @@ def clear_filters(n_clicks):
         return [None] * 14  # Clear all 14 filter inputs
     return [dash.no_update] * 14
 
-@app.callback(
-    Output("total-stocks", "children"),
-    [Input("filtered-data", "children")]
-)
-def update_total_stocks(filtered_json):
-    """Update total stocks count"""
-    try:
-        all_stocks = stock_service.get_all_stocks()
-        return len(all_stocks)
-    except Exception as e:
-        logger.error(f"Error getting total stocks: {str(e)}")
-        return 0
-
 if __name__ == "__main__":
     app.run_server(debug=True, host="0.0.0.0", port=8051)
 
@@ -1,22 +1,64 @@
 """
 Utility functions for the dashboard application.
 """
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+import math
+import time
+from bisect import bisect_right
+from functools import lru_cache
 import pandas as pd
 import numpy as np
+import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import logging
 
 from .config import (
     DEFAULT_START_DATE, DEFAULT_END_DATE, DEFAULT_ANALYSIS_PERIOD_DAYS,
     ERROR_MESSAGES, SUCCESS_MESSAGES, VALIDATION_RULES,
-    SHARPE_COLOR_MAPPING, CHART_COLORS
+    SHARPE_COLOR_MAPPING, CHART_COLORS, MAX_CHART_POINTS
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Below this many items, per-item Python formatting beats NumPy's call overhead
+VECTORIZED_FORMAT_MIN_SIZE = 16
+
+# Longest ticker symbol accepted by ValidationHelper.validate_stock_symbols
+MAX_SYMBOL_LENGTH = 10
+
+# Date formats used for query parameters and for display
+DATE_FORMAT = '%Y-%m-%d'
+DISPLAY_DATE_FORMAT = '%b %d, %Y'
+
+# Sharpe color thresholds in ascending order, with the color of each band
+_SHARPE_BANDS = sorted((config["threshold"], config["color"]) for config in SHARPE_COLOR_MAPPING.values())
+_SHARPE_THRESHOLDS = tuple(threshold for threshold, _ in _SHARPE_BANDS)
+_SHARPE_COLORS = tuple(color for _, color in _SHARPE_BANDS)
+
+
+def _build_empty_figure() -> Dict[str, Any]:
+    """Build the serialized layout shared by every empty figure."""
+    fig = go.Figure()
+    fig.add_annotation(
+        text="No data available",
+        xref="paper", yref="paper",
+        x=0.5, y=0.5, showarrow=False,
+        font=dict(size=16, color="gray")
+    )
+    fig.update_layout(
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False),
+        plot_bgcolor='white'
+    )
+    return fig.to_plotly_json()
+
+
+# Empty figures are served as plain dicts copied from this template
+_EMPTY_FIGURE = _build_empty_figure()
+_EMPTY_FIGURE_ANNOTATION = _EMPTY_FIGURE["layout"]["annotations"][0]
+
 
 class DatabaseManager:
     """Manages database operations and provides a clean interface."""
@@ -94,9 +136,11 @@ class PortfolioCalculator:
     @staticmethod
     def format_return_display(return_value: Any) -> str:
         """Format return value for display."""
-        if isinstance(return_value, (int, float)):
-            return f"{return_value:.1%}"
-        return str(return_value)
+        # Numbers are the common case; messages and other values fall through to str()
+        try:
+            return format(return_value, ".1%")
+        except (TypeError, ValueError):
+            return str(return_value)
     
     @staticmethod
     def format_assets_with_percentages(portfolio: Dict[str, Any]) -> str:
@@ -110,11 +154,12 @@ class PortfolioCalculator:
         if len(symbols) != len(weights):
             return "Invalid portfolio data"
         
-        formatted_assets = []
-        for symbol, weight in zip(symbols, weights):
-            formatted_assets.append(f"{symbol} ({weight:.1%})")
+        # Small portfolios are cheaper to format directly than through NumPy
+        if len(weights) < VECTORIZED_FORMAT_MIN_SIZE:
+            return ", ".join(f"{symbol} ({weight:.1%})" for symbol, weight in zip(symbols, weights))
         
-        return ", ".join(formatted_assets)
+        percentages = np.char.mod("%.1f%%", np.asarray(weights, dtype=np.float64) * 100.0)
+        return ", ".join(f"{symbol} ({percentage})" for symbol, percentage in zip(symbols, percentages))
 
 
 class ValidationHelper:
@@ -130,8 +175,11 @@ class ValidationHelper:
         invalid_symbols = []
         
         for symbol in symbols:
+            if not isinstance(symbol, str):
+                invalid_symbols.append(symbol)
+                continue
             symbol = symbol.strip().upper()
-            if symbol and len(symbol) <= 10 and symbol.isalpha():
+            if symbol and len(symbol) <= MAX_SYMBOL_LENGTH and symbol.isalpha():
                 valid_symbols.append(symbol)
             else:
                 invalid_symbols.append(symbol)
@@ -144,8 +192,9 @@ class ValidationHelper:
         if not weights:
             return False
         
-        # Check if weights sum to approximately 1.0
-        total_weight = sum(weights)
+        # Check if weights sum to approximately 1.0; fsum is exactly rounded, so
+        # float noise from weight arithmetic cannot tip the tolerance check
+        total_weight = math.fsum(weights)
         return abs(total_weight - 1.0) < 0.01
     
     @staticmethod
@@ -166,29 +215,39 @@ class ChartHelper:
     @staticmethod
     def get_sharpe_color(sharpe_ratio: float) -> str:
         """Get color based on Sharpe ratio."""
-        for level, config in SHARPE_COLOR_MAPPING.items():
-            if sharpe_ratio >= config["threshold"]:
-                return config["color"]
-        return "danger"
+        # Also rejects NaN, which compares false against every threshold
+        if not sharpe_ratio >= _SHARPE_THRESHOLDS[0]:
+            return "danger"
+        return _SHARPE_COLORS[bisect_right(_SHARPE_THRESHOLDS, sharpe_ratio) - 1]
     
     @staticmethod
-    def create_empty_figure(message: str = "No data available") -> 'go.Figure':
+    def create_empty_figure(message: str = "No data available") -> Dict[str, Any]:
         """Create an empty figure with a message."""
-        import plotly.graph_objects as go
-        
-        fig = go.Figure()
-        fig.add_annotation(
-            text=message,
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=16, color="gray")
-        )
-        fig.update_layout(
-            xaxis=dict(visible=False),
-            yaxis=dict(visible=False),
-            plot_bgcolor='white'
-        )
-        return fig
+        # Only the annotation text changes; everything else is shared with the template
+        layout = dict(_EMPTY_FIGURE["layout"])
+        layout["annotations"] = [dict(_EMPTY_FIGURE_ANNOTATION, text=message)]
+        return {"data": [], "layout": layout}
+
+
+def _parse_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD string, using the C ISO parser for zero-padded dates."""
+    # fromisoformat also accepts times and week dates (2024-W01-1), so only
+    # plain zero-padded dates take the fast path; strptime stays the authority
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, DATE_FORMAT)
+
+
+@lru_cache(maxsize=32)
+def _analysis_date_range(days: int, minute_bucket: int) -> Tuple[str, str]:
+    """Compute the analysis date range; cached per minute bucket."""
+    now = datetime.now()
+    end_date = now.strftime(DATE_FORMAT)
+    start_date = (now - timedelta(days=days)).strftime(DATE_FORMAT)
+    return start_date, end_date
 
 
 class DateHelper:
@@ -197,16 +256,15 @@ class DateHelper:
     @staticmethod
     def get_analysis_date_range(days: int = DEFAULT_ANALYSIS_PERIOD_DAYS) -> Tuple[str, str]:
         """Get start and end dates for analysis."""
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-        return start_date, end_date
+        return _analysis_date_range(days, int(time.time()) // 60)
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def format_date_range(start_date: str, end_date: str) -> str:
         """Format date range for display."""
         try:
-            start = datetime.strptime(start_date, '%Y-%m-%d').strftime('%b %d, %Y')
-            end = datetime.strptime(end_date, '%Y-%m-%d').strftime('%b %d, %Y')
+            start = _parse_date(start_date).strftime(DISPLAY_DATE_FORMAT)
+            end = _parse_date(end_date).strftime(DISPLAY_DATE_FORMAT)
             return f"{start} - {end}"
         except ValueError:
             return f"{start_date} - {end_date}"
@@ -234,11 +292,13 @@ class ErrorHandler:
         return f"Invalid {field}"
 
 
-def ensure_pandas_series(data: Any) -> pd.Series:
-    """Ensure data is a pandas Series for calculations."""
+def ensure_pandas_series(data: Union[pd.Series, pd.Index, np.ndarray, Sequence[float]]) -> pd.Series:
+    """Ensure data is a pandas Series for calculations; arrays are wrapped without copying."""
     if isinstance(data, pd.Series):
         return data
-    elif isinstance(data, (list, np.ndarray)):
+    elif isinstance(data, (np.ndarray, pd.Index)):
+        return pd.Series(data, copy=False)
+    elif isinstance(data, list):
         return pd.Series(data)
     else:
         raise ValueError(f"Cannot convert {type(data)} to pandas Series")
@@ -246,7 +306,81 @@ def ensure_pandas_series(data: Any) -> pd.Series:
 
 def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
     """Safely divide two numbers, returning default if denominator is zero."""
+    if isinstance(numerator, np.ndarray) or isinstance(denominator, np.ndarray):
+        return safe_divide_array(numerator, denominator, default)
     try:
         return numerator / denominator if denominator != 0 else default
     except (TypeError, ZeroDivisionError):
         return default
+
+
+def safe_divide_array(numerator: np.ndarray, denominator: np.ndarray, default: float = 0.0) -> np.ndarray:
+    """Element-wise safe_divide in one masked NumPy divide; default wherever the denominator is zero."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    result = np.full(np.broadcast(numerator, denominator).shape, default, dtype=np.float64)
+    np.divide(numerator, denominator, out=result, where=denominator != 0)
+    return result
+
+
+def lttb_indices(y: Union[np.ndarray, Sequence[float]], n_out: int) -> np.ndarray:
+    """Select n_out point indices with Largest-Triangle-Three-Buckets downsampling."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.arange(n, dtype=float)
+    # Interior points are split into n_out - 2 buckets; first and last are kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick
+        # and the next bucket's average
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        indices[i + 1] = a
+    
+    return indices
+
+
+def downsample_xy(x: Union[np.ndarray, pd.Index, Sequence[Any]], y: Union[np.ndarray, Sequence[float]],
+                  n_out: int = MAX_CHART_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """Downsample an x/y series with LTTB before it is shipped to the browser."""
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    indices = lttb_indices(y, n_out)
+    return x[indices], y[indices]
+
+
+def rolling_std(values: Union[np.ndarray, Sequence[float]], window: int) -> np.ndarray:
+    """Rolling sample standard deviation in O(N) from running sums; matches pandas rolling(window).std()."""
+    x = np.asarray(values, dtype=float)
+    result = np.full(len(x), np.nan)
+    if len(x) < window:
+        return result
+    
+    # Windowed sums of x, x^2 and missing values via prefix-sum differences
+    missing = np.isnan(x)
+    filled = np.where(missing, 0.0, x)
+    sum_x = np.concatenate(([0.0], np.cumsum(filled)))
+    sum_sq = np.concatenate(([0.0], np.cumsum(filled * filled)))
+    n_missing = np.concatenate(([0], np.cumsum(missing)))
+    window_sum = sum_x[window:] - sum_x[:-window]
+    window_sq = sum_sq[window:] - sum_sq[:-window]
+    window_missing = n_missing[window:] - n_missing[:-window]
+    
+    variance = (window_sq - window_sum * window_sum / window) / (window - 1)
+    std = np.sqrt(np.maximum(variance, 0.0))
+    std[window_missing > 0] = np.nan
+    result[window - 1:] = std
+    return result
@@ -0,0 +1,209 @@
+"""
+Unit tests for the numeric, validation and date helpers in the dashboard utilities.
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.visualization.dash_app.config import SHARPE_COLOR_MAPPING
+from src.visualization.dash_app.utils import (
+    DATE_FORMAT, ChartHelper, ValidationHelper, _parse_date, downsample_xy, lttb_indices,
+    rolling_std, safe_divide, safe_divide_array
+)
+
+
+def reference_sharpe_color(sharpe_ratio):
+    """Linear scan over the color mapping, as get_sharpe_color originally did."""
+    for config in SHARPE_COLOR_MAPPING.values():
+        if sharpe_ratio >= config["threshold"]:
+            return config["color"]
+    return "danger"
+
+
+class TestRollingStd:
+    """rolling_std must match pandas rolling(window).std()."""
+
+    @pytest.mark.parametrize("window", [2, 5, 30])
+    def test_matches_pandas_on_random_returns(self, window):
+        rng = np.random.default_rng(0)
+        values = rng.normal(0.0005, 0.02, size=500)
+
+        expected = pd.Series(values).rolling(window).std().to_numpy()
+        np.testing.assert_allclose(rolling_std(values, window), expected, rtol=1e-6, atol=1e-12)
+
+    def test_warm_up_period_is_nan(self):
+        values = np.arange(40, dtype=float)
+        result = rolling_std(values, 30)
+
+        assert np.isnan(result[:29]).all()
+        assert not np.isnan(result[29:]).any()
+
+    def test_windows_containing_nan_are_nan(self):
+        rng = np.random.default_rng(1)
+        values = rng.normal(size=200)
+        values[[10, 75, 76, 150]] = np.nan
+
+        expected = pd.Series(values).rolling(30).std().to_numpy()
+        result = rolling_std(values, 30)
+
+        np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+        np.testing.assert_allclose(result, expected, rtol=1e-6, atol=1e-12)
+
+    @pytest.mark.parametrize("length", [0, 1, 29])
+    def test_input_shorter_than_window_is_all_nan(self, length):
+        result = rolling_std(np.ones(length), 30)
+
+        assert len(result) == length
+        assert np.isnan(result).all()
+
+    def test_constant_series_has_zero_volatility(self):
+        result = rolling_std(np.full(60, 0.01), 30)
+
+        np.testing.assert_allclose(result[29:], 0.0, atol=1e-9)
+
+    def test_accepts_pandas_series(self):
+        values = pd.Series(np.linspace(-1.0, 1.0, 50) ** 3)
+
+        expected = values.rolling(10).std().to_numpy()
+        np.testing.assert_allclose(rolling_std(values, 10), expected, rtol=1e-6, atol=1e-12)
+
+
+class TestLttbIndices:
+    """lttb_indices keeps the endpoints and picks one point per bucket."""
+
+    @pytest.mark.parametrize("n, n_out", [(1000, 100), (5000, 2000), (101, 3), (10, 9)])
+    def test_bucket_invariants(self, n, n_out):
+        rng = np.random.default_rng(2)
+        y = np.cumsum(rng.normal(size=n))
+        indices = lttb_indices(y, n_out)
+
+        assert len(indices) == n_out
+        assert indices[0] == 0
+        assert indices[-1] == n - 1
+        assert (np.diff(indices) > 0).all()
+
+        # Every interior pick lies inside its own bucket
+        edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+        for i, index in enumerate(indices[1:-1]):
+            assert edges[i] <= index < edges[i + 1]
+
+    @pytest.mark.parametrize("n, n_out", [(0, 10), (1, 10), (10, 10), (10, 20), (10, 2)])
+    def test_short_input_is_returned_whole(self, n, n_out):
+        np.testing.assert_array_equal(lttb_indices(np.arange(n, dtype=float), n_out), np.arange(n))
+
+    def test_keeps_spike(self):
+        y = np.zeros(1000)
+        y[537] = 10.0
+
+        assert 537 in lttb_indices(y, 50)
+
+    def test_nan_values_are_not_selected_over_finite_points(self):
+        rng = np.random.default_rng(3)
+        y = rng.normal(size=1000)
+        y[200:220] = np.nan
+        indices = lttb_indices(y, 100)
+
+        assert len(indices) == 100
+        assert (np.diff(indices) > 0).all()
+
+
+class TestDownsampleXY:
+    """downsample_xy returns matching x and y samples."""
+
+    def test_x_and_y_stay_aligned(self):
+        dates = pd.date_range("2023-01-01", periods=3000, freq="D")
+        y = np.sin(np.linspace(0, 20, 3000))
+        x_out, y_out = downsample_xy(dates, y, n_out=500)
+
+        positions = dates.get_indexer(x_out)
+        assert len(x_out) == len(y_out) == 500
+        np.testing.assert_array_equal(y_out, y[positions])
+        assert x_out[0] == dates[0].to_datetime64()
+        assert x_out[-1] == dates[-1].to_datetime64()
+
+    def test_short_series_is_unchanged(self):
+        x_out, y_out = downsample_xy([1, 2, 3], [4.0, 5.0, 6.0])
+
+        np.testing.assert_array_equal(x_out, [1, 2, 3])
+        np.testing.assert_array_equal(y_out, [4.0, 5.0, 6.0])
+
+
+class TestSafeDivideArray:
+    """safe_divide_array must match scalar safe_divide element by element."""
+
+    def test_matches_scalar_safe_divide(self):
+        rng = np.random.default_rng(4)
+        numerator = rng.normal(size=200)
+        denominator = rng.normal(size=200)
+        denominator[::7] = 0.0
+        denominator[3] = np.nan
+        numerator[5] = np.nan
+
+        expected = [safe_divide(float(n), float(d), default=-1.0) for n, d in zip(numerator, denominator)]
+        np.testing.assert_array_equal(safe_divide_array(numerator, denominator, default=-1.0), expected)
+
+    def test_broadcasts_scalar_denominator(self):
+        np.testing.assert_array_equal(safe_divide_array([1.0, 2.0], 0.0), [0.0, 0.0])
+        np.testing.assert_array_equal(safe_divide_array([1.0, 2.0], 2.0), [0.5, 1.0])
+
+    def test_empty_input(self):
+        assert safe_divide_array([], []).shape == (0,)
+
+    def test_safe_divide_delegates_arrays(self):
+        result = safe_divide(np.array([1.0, 1.0]), np.array([0.0, 4.0]))
+
+        np.testing.assert_array_equal(result, [0.0, 0.25])
+
+
+class TestGetSharpeColor:
+    """get_sharpe_color must match the original threshold scan."""
+
+    def test_matches_reference_on_random_values(self):
+        rng = np.random.default_rng(5)
+        for value in rng.normal(0.5, 1.5, size=1000):
+            assert ChartHelper.get_sharpe_color(value) == reference_sharpe_color(value)
+
+    @pytest.mark.parametrize("value", [
+        -np.inf, -1.0, -1e-12, 0.0, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, np.inf
+    ])
+    def test_thresholds_and_boundaries(self, value):
+        assert ChartHelper.get_sharpe_color(value) == reference_sharpe_color(value)
+
+    def test_nan_is_danger(self):
+        assert ChartHelper.get_sharpe_color(float("nan")) == "danger"
+        assert ChartHelper.get_sharpe_color(np.nan) == reference_sharpe_color(np.nan)
+
+
+class TestValidateStockSymbols:
+    """validate_stock_symbols splits symbols into valid and invalid lists."""
+
+    def test_normalizes_and_splits(self):
+        valid, invalid = ValidationHelper.validate_stock_symbols([" aapl ", "MSFT", "BRK.B", "", "TOOLONGSYMBOL"])
+
+        assert valid == ["AAPL", "MSFT"]
+        assert invalid == ["BRK.B", "", "TOOLONGSYMBOL"]
+
+    def test_non_strings_are_invalid(self):
+        assert ValidationHelper.validate_stock_symbols(["AAPL", None, 42]) == (["AAPL"], [None, 42])
+
+    def test_empty_input(self):
+        assert ValidationHelper.validate_stock_symbols([]) == ([], [])
+
+
+class TestParseDate:
+    """_parse_date accepts exactly what strptime with DATE_FORMAT accepts."""
+
+    @pytest.mark.parametrize("value", [
+        "2024-01-05", "2024-1-5", "2024-12-31", "2024-01-01T10:00", "2024-W01-1",
+        "20240105", "2024-02-30", "2024-001", "2024-01-5 ", ""
+    ])
+    def test_matches_strptime(self, value):
+        try:
+            expected = datetime.strptime(value, DATE_FORMAT)
+        except ValueError:
+            with pytest.raises(ValueError):
+                _parse_date(value)
+        else:
+            assert _parse_date(value) == expected
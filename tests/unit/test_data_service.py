@@ -0,0 +1,97 @@
+"""
+Unit tests for the dashboard data service's categorical symbol column.
+"""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# data_service imports the ETL loader from src, as the dashboard does
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'src'))
+from etl.loaders import database_loader  # noqa: E402
+
+with patch.object(database_loader, 'DatabaseLoader'):
+    from src.data_access import data_service as ds  # noqa: E402
+
+
+def make_performance(symbols=('MSFT', 'AAPL', 'XOM'), days=30):
+    """portfolio_data rows as returned by the database, ordered by date then insert order."""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range('2024-01-01', periods=days, freq='D')
+    data = pd.DataFrame({
+        'date': np.repeat(dates, len(symbols)),
+        'symbol': list(symbols) * days,
+        'weight': 1.0 / len(symbols),
+        'returns': rng.normal(0.001, 0.02, size=days * len(symbols)),
+        'value': 100.0,
+    })
+    data.loc[[4, 40], 'returns'] = np.nan
+    return data
+
+
+@pytest.fixture
+def service():
+    """DataService whose loader returns canned frames."""
+    service = ds.DataService.__new__(ds.DataService)
+    service.db_loader = MagicMock()
+    return service
+
+
+class TestCategoricalSymbol:
+    """A categorical symbol column must give the same results as plain text."""
+
+    def test_prices_symbol_is_categorical(self, service):
+        service.db_loader.query_data.return_value = make_performance()
+
+        result = service.get_stock_prices()
+
+        assert isinstance(result['symbol'].dtype, pd.CategoricalDtype)
+        assert result['symbol'].astype(object).tolist() == make_performance()['symbol'].tolist()
+
+    def test_portfolio_summary_matches_text_symbols(self, service):
+        expected_data = make_performance()
+        service.db_loader.query_data.side_effect = [make_performance(), pd.DataFrame()]
+
+        summary = service.get_portfolio_summary()
+
+        assert summary['total_symbols'] == expected_data['symbol'].nunique()
+        assert summary['symbols'] == expected_data['symbol'].unique().tolist()
+        assert summary['total_return'] == expected_data.groupby('symbol')['returns'].sum().mean()
+
+    def test_correlation_matrix_matches_text_symbols(self, service):
+        expected_data = make_performance()
+        expected_data = expected_data[expected_data['symbol'].isin(['XOM', 'MSFT'])]
+        expected = expected_data.pivot(index='date', columns='symbol', values='returns').corr()
+        service.db_loader.query_data.return_value = make_performance()
+
+        result = service.get_correlation_matrix(symbols=['XOM', 'MSFT'])
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_observed_groupby_matches_text_symbols(self):
+        # The pattern the dashboard charts use: symbol-major sort, then unsorted groups
+        def cumulative_by_symbol(data):
+            data = data.sort_values(['symbol', 'date'], kind='mergesort')
+            data['cumulative_return'] = data.groupby('symbol', sort=False, observed=True)['returns'].cumsum()
+            return [(str(symbol), group['cumulative_return'].to_numpy())
+                    for symbol, group in data.groupby('symbol', sort=False, observed=True)]
+
+        expected = cumulative_by_symbol(make_performance())
+        result = cumulative_by_symbol(ds._with_categorical_symbol(make_performance()))
+
+        assert [symbol for symbol, _ in result] == [symbol for symbol, _ in expected] == ['AAPL', 'MSFT', 'XOM']
+        for (_, values), (_, expected_values) in zip(result, expected):
+            np.testing.assert_array_equal(values, expected_values)
+
+    def test_filtered_frames_have_no_empty_groups(self):
+        text_data = make_performance()
+        categorical_data = ds._with_categorical_symbol(make_performance())
+
+        expected = text_data[text_data['symbol'] != 'AAPL'].groupby('symbol')['returns'].sum()
+        result = categorical_data[categorical_data['symbol'] != 'AAPL'].groupby('symbol', observed=True)['returns'].sum()
+
+        assert result.index.astype(object).tolist() == expected.index.tolist() == ['MSFT', 'XOM']
+        np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
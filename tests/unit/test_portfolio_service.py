@@ -0,0 +1,62 @@
+"""
+Unit tests for the portfolio management service.
+"""
+import math
+
+import pytest
+
+from src.data_access.portfolio_management_service import PortfolioManagementService
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis client's get/setex."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+@pytest.fixture
+def service():
+    """Service with an in-memory analytics cache and no database engine."""
+    service = PortfolioManagementService.__new__(PortfolioManagementService)
+    service.redis_client = FakeRedis()
+    service.redis_available = True
+    return service
+
+
+class TestAnalyticsCache:
+    """Cached analytics must come back exactly as they were stored."""
+
+    def test_round_trip_preserves_nan_and_inf(self, service):
+        analytics = {
+            'total_return': 0.125,
+            'sharpe_ratio': float('nan'),
+            'portfolio_volatility': float('inf'),
+            'max_drawdown': -0.2,
+        }
+        key = service._generate_cache_key(['AAPL', 'MSFT'], [0.5, 0.5])
+
+        assert service._cache_analytics(key, analytics)
+        cached = service._get_cached_analytics(key)
+
+        assert math.isnan(cached['sharpe_ratio'])
+        assert cached['portfolio_volatility'] == float('inf')
+        assert cached['total_return'] == 0.125
+        assert cached['max_drawdown'] == -0.2
+        # Metrics are still formattable after a cache hit
+        assert f"{cached['sharpe_ratio']:.3f}" == "nan"
+
+    def test_miss_returns_none(self, service):
+        assert service._get_cached_analytics("portfolio_analytics:missing") is None
+
+    def test_unavailable_cache_is_skipped(self, service):
+        service.redis_available = False
+
+        assert not service._cache_analytics("key", {'total_return': 0.1})
+        assert service._get_cached_analytics("key") is None
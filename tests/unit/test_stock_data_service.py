@@ -0,0 +1,135 @@
+"""
+Unit tests for the stock data service's batched fetching.
+"""
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.data_access import stock_data_service as sds
+from src.data_access.stock_data_service import StockDataService
+
+
+def make_history(symbols, days=5):
+    """yf.download-style frame grouped by ticker."""
+    index = pd.date_range("2024-01-01", periods=days, freq="D")
+    frames = {
+        symbol: pd.DataFrame({
+            'Open': np.linspace(100.0, 104.0, days),
+            'High': np.linspace(101.0, 105.0, days),
+            'Low': np.linspace(99.0, 103.0, days),
+            'Close': np.linspace(100.5, 104.5, days),
+            'Volume': np.full(days, 1000),
+        }, index=index)
+        for symbol in symbols
+    }
+    return pd.concat(frames, axis=1)
+
+
+@pytest.fixture
+def service():
+    """Service with no real database, Redis or API access."""
+    with patch.object(sds, 'create_engine'), patch.object(sds.redis, 'Redis'):
+        service = StockDataService()
+    service.rate_limit_delay = 0
+    with patch.object(service, 'store_stock_data', return_value=True), \
+            patch.object(service, 'get_symbols_with_data', return_value={'XOM'}), \
+            patch.object(service, 'fetch_from_yahoo_finance') as per_symbol_fetch:
+        service.per_symbol_fetch = per_symbol_fetch
+        yield service
+
+
+@pytest.fixture
+def yf_download():
+    """Patched yfinance module; the test sets download's behaviour."""
+    yfinance = MagicMock()
+    with patch.dict(sys.modules, {'yfinance': yfinance}):
+        yield yfinance.download
+
+
+class TestFetchAndStoreMissingStockData:
+    """Missing symbols are fetched with one download and stored."""
+
+    def test_batch_path_downloads_missing_symbols_once(self, service, yf_download):
+        yf_download.return_value = make_history(['AAPL', 'MSFT'])
+
+        results = service.fetch_and_store_missing_stock_data(['aapl', 'MSFT', 'XOM', 'MSFT '])
+
+        assert results == {'XOM': True, 'AAPL': True, 'MSFT': True}
+        yf_download.assert_called_once()
+        assert yf_download.call_args.args[0] == ['AAPL', 'MSFT']
+        stored = {call.args[0]: call.args[1] for call in service.store_stock_data.call_args_list}
+        assert set(stored) == {'AAPL', 'MSFT'}
+        assert len(stored['AAPL']) == 5
+        assert stored['AAPL'][0] == {
+            'date': '2024-01-01', 'open': 100.0, 'high': 101.0, 'low': 99.0, 'close': 100.5, 'volume': 1000
+        }
+        service.per_symbol_fetch.assert_not_called()
+
+    def test_present_symbols_skip_download(self, service, yf_download):
+        assert service.fetch_and_store_missing_stock_data(['XOM']) == {'XOM': True}
+
+        yf_download.assert_not_called()
+        service.store_stock_data.assert_not_called()
+
+    def test_symbols_missing_from_batch_use_fallback_without_retry(self, service, yf_download):
+        yf_download.return_value = make_history(['AAPL'])
+
+        with patch.object(service, 'generate_sample_data', wraps=service.generate_sample_data) as sample:
+            results = service.fetch_and_store_missing_stock_data(['AAPL', 'MSFT'])
+
+        assert results == {'AAPL': True, 'MSFT': True}
+        sample.assert_called_once_with('MSFT')
+        service.per_symbol_fetch.assert_not_called()
+        assert yf_download.call_count == 1
+
+    def test_failed_download_falls_back_for_every_symbol(self, service, yf_download):
+        yf_download.side_effect = RuntimeError("rate limited")
+
+        with patch.object(service, 'generate_sample_data', wraps=service.generate_sample_data) as sample:
+            results = service.fetch_and_store_missing_stock_data(['AAPL', 'MSFT'])
+
+        assert results == {'AAPL': True, 'MSFT': True}
+        assert sorted(call.args[0] for call in sample.call_args_list) == ['AAPL', 'MSFT']
+        service.per_symbol_fetch.assert_not_called()
+
+    def test_failed_store_is_reported(self, service, yf_download):
+        yf_download.return_value = make_history(['AAPL'])
+        service.store_stock_data.return_value = False
+
+        assert service.fetch_and_store_missing_stock_data(['AAPL']) == {'AAPL': False}
+
+
+class TestGetSymbolsWithData:
+    """get_symbols_with_data checks every symbol with a single query."""
+
+    @pytest.fixture
+    def service(self):
+        with patch.object(sds, 'create_engine'), patch.object(sds.redis, 'Redis'):
+            service = StockDataService()
+        service.engine = create_engine("sqlite://")
+        with service.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE stock_prices (symbol TEXT, date TEXT, close REAL)"))
+            conn.execute(text(
+                "INSERT INTO stock_prices VALUES "
+                "('AAPL', '2024-01-01', 1.0), ('AAPL', '2024-01-02', 2.0), ('MSFT', '2024-01-01', 3.0)"
+            ))
+        return service
+
+    def test_returns_stored_subset(self, service):
+        assert service.get_symbols_with_data(['AAPL', 'MSFT', 'XOM']) == {'AAPL', 'MSFT'}
+
+    def test_empty_input_skips_query(self, service):
+        service.engine = MagicMock()
+
+        assert service.get_symbols_with_data([]) == set()
+        service.engine.connect.assert_not_called()
+
+    def test_query_errors_report_nothing_stored(self, service):
+        service.engine = MagicMock()
+        service.engine.connect.side_effect = RuntimeError("db down")
+
+        assert service.get_symbols_with_data(['AAPL']) == set()
@@ -0,0 +1,236 @@
+"""
+Unit tests for the stock filtering service.
+"""
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from src.data_access import stock_filtering_service as sfs
+from src.data_access.stock_filtering_service import StockFilteringService, _with_categorical_dtypes
+
+
+def make_stocks():
+    """Small stock_info frame as returned by read_sql."""
+    return pd.DataFrame({
+        'symbol': ['AAPL', 'MSFT', 'XOM'],
+        'sector': ['Technology', 'Technology', 'Energy'],
+        'industry': ['Consumer Electronics', 'Software', 'Oil & Gas'],
+        'market_cap_category': ['Mega Cap', 'Mega Cap', 'Large Cap'],
+        'market_cap': [3.0e12, 2.8e12, 4.0e11],
+    })
+
+
+@pytest.fixture
+def service():
+    """Service whose engine is never connected."""
+    with patch.object(sfs, 'create_engine'):
+        yield StockFilteringService()
+
+
+@pytest.fixture
+def read_sql():
+    """Patched pd.read_sql returning a fresh stock frame on every call."""
+    with patch.object(sfs.pd, 'read_sql', side_effect=lambda *args, **kwargs: make_stocks()) as mock:
+        yield mock
+
+
+class TestFilterCache:
+    """get_stocks_by_filters reuses recent results for equivalent filters."""
+
+    def test_repeated_filters_hit_cache(self, service, read_sql):
+        first = service.get_stocks_by_filters({'sectors': ['Technology']})
+        second = service.get_stocks_by_filters({'sectors': ['Technology']})
+
+        assert read_sql.call_count == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_equivalent_filters_share_an_entry(self, service, read_sql):
+        service.get_stocks_by_filters({'sectors': ['Technology', 'Energy'], 'pe_ratio_min': None})
+        service.get_stocks_by_filters({'sectors': ['Energy', 'Technology'], 'industries': []})
+
+        assert read_sql.call_count == 1
+
+    def test_different_filters_query_again(self, service, read_sql):
+        service.get_stocks_by_filters({'sectors': ['Technology']})
+        service.get_stocks_by_filters({'sectors': ['Energy']})
+
+        assert read_sql.call_count == 2
+
+    def test_all_stocks_share_the_cache(self, service, read_sql):
+        service.get_all_stocks()
+        service.get_stocks_by_filters({})
+
+        assert read_sql.call_count == 1
+
+    def test_results_are_copies(self, service, read_sql):
+        result = service.get_stocks_by_filters({})
+        result.loc[0, 'symbol'] = 'CHANGED'
+
+        assert service.get_stocks_by_filters({}).loc[0, 'symbol'] == 'AAPL'
+
+    def test_entries_expire_after_ttl(self, service, read_sql):
+        with patch.object(sfs.time, 'monotonic', return_value=1000.0):
+            service.get_stocks_by_filters({})
+        with patch.object(sfs.time, 'monotonic', return_value=1000.0 + sfs.FILTER_CACHE_TTL_SECONDS):
+            service.get_stocks_by_filters({})
+
+        assert read_sql.call_count == 2
+
+    def test_invalidate_drops_entries(self, service, read_sql):
+        service.get_stocks_by_filters({})
+        service.invalidate_filter_cache()
+        service.get_stocks_by_filters({})
+
+        assert read_sql.call_count == 2
+
+    def test_cache_is_bounded(self, service, read_sql):
+        for i in range(sfs.FILTER_CACHE_SIZE + 5):
+            service.get_stocks_by_filters({'price_min': i})
+
+        assert len(service._filter_cache) == sfs.FILTER_CACHE_SIZE
+        # The oldest entries were evicted first
+        service.get_stocks_by_filters({'price_min': 0})
+        assert read_sql.call_count == sfs.FILTER_CACHE_SIZE + 6
+
+    def test_query_errors_are_not_cached(self, service):
+        with patch.object(sfs.pd, 'read_sql', side_effect=RuntimeError("db down")):
+            assert service.get_stocks_by_filters({}).empty
+
+        with patch.object(sfs.pd, 'read_sql', side_effect=lambda *args, **kwargs: make_stocks()):
+            assert len(service.get_stocks_by_filters({})) == 3
+
+
+class TestBuildFilterQuery:
+    """_build_filter_query binds every filter value instead of pasting it into the SQL."""
+
+    @pytest.fixture
+    def engine(self):
+        """In-memory stock_info table for running the built queries."""
+        engine = create_engine("sqlite://")
+        pd.DataFrame({
+            'symbol': ['AAPL', 'MSFT', 'XOM', 'ORLY', 'NOPE'],
+            'sector': ['Technology', 'Technology', 'Energy', "O'Reilly Auto", 'Energy'],
+            'industry': ['Consumer Electronics', 'Software', 'Oil & Gas', 'Retail', 'Oil & Gas'],
+            'market_cap_category': ['Mega Cap', 'Mega Cap', 'Large Cap', 'Large Cap', 'Small Cap'],
+            'market_cap': [3.0e12, 2.8e12, 4.0e11, 6.0e10, 1.0e9],
+            'pe_ratio': [30.0, 35.0, 12.0, 25.0, None],
+            'current_price': [190.0, 410.0, 110.0, 900.0, 0.0],
+        }).to_sql('stock_info', engine, index=False)
+        return engine
+
+    def run(self, engine, filters):
+        query, params = StockFilteringService._build_filter_query(filters)
+        return pd.read_sql(query, engine, params=params)['symbol'].tolist()
+
+    def test_no_filters_select_everything(self, engine):
+        query, params = StockFilteringService._build_filter_query({})
+
+        assert query.text == "SELECT * FROM stock_info WHERE 1=1 ORDER BY market_cap DESC"
+        assert params == {}
+        assert self.run(engine, {}) == ['AAPL', 'MSFT', 'XOM', 'ORLY', 'NOPE']
+
+    def test_in_filters_bind_expanding_lists(self, engine):
+        filters = {'sectors': ['Energy', 'Technology'], 'market_cap_categories': ['Mega Cap']}
+        query, params = StockFilteringService._build_filter_query(filters)
+
+        assert query.text == (
+            "SELECT * FROM stock_info WHERE market_cap_category IN :market_cap_categories "
+            "AND sector IN :sectors ORDER BY market_cap DESC"
+        )
+        assert params == {'market_cap_categories': ['Mega Cap'], 'sectors': ['Energy', 'Technology']}
+        assert self.run(engine, filters) == ['AAPL', 'MSFT']
+
+    def test_empty_and_missing_lists_add_no_condition(self, engine):
+        filters = {'sectors': [], 'industries': None}
+        query, params = StockFilteringService._build_filter_query(filters)
+
+        assert "IN" not in query.text
+        assert params == {}
+        assert len(self.run(engine, filters)) == 5
+
+    def test_values_are_not_pasted_into_sql(self, engine):
+        filters = {'sectors': ["O'Reilly Auto"]}
+        query, _ = StockFilteringService._build_filter_query(filters)
+
+        assert "Reilly" not in query.text
+        assert self.run(engine, filters) == ['ORLY']
+
+    def test_open_ended_ranges_bind_only_given_bounds(self, engine):
+        filters = {'pe_ratio_min': 20, 'price_max': None}
+        query, params = StockFilteringService._build_filter_query(filters)
+
+        assert query.text == "SELECT * FROM stock_info WHERE pe_ratio >= :pe_ratio_min ORDER BY market_cap DESC"
+        assert params == {'pe_ratio_min': 20}
+        # NULL values never satisfy a bound
+        assert self.run(engine, filters) == ['AAPL', 'MSFT', 'ORLY']
+
+    def test_zero_bounds_are_applied(self, engine):
+        filters = {'price_min': 0, 'price_max': 0}
+        _, params = StockFilteringService._build_filter_query(filters)
+
+        assert params == {'price_min': 0, 'price_max': 0}
+        assert self.run(engine, filters) == ['NOPE']
+
+    def test_ranges_combine_with_in_filters(self, engine):
+        filters = {'sectors': ['Technology', 'Energy'], 'pe_ratio_max': 31, 'price_min': 100}
+
+        assert self.run(engine, filters) == ['AAPL', 'XOM']
+
+
+class TestCategoricalDtypes:
+    """Categorical columns must give the same results as the plain text columns."""
+
+    @pytest.fixture
+    def stocks(self):
+        return pd.DataFrame({
+            'symbol': ['A', 'B', 'C', 'D', 'E', 'F', 'G'],
+            'sector': ['Technology', 'Energy', 'Energy', 'Technology', 'Utilities', None, 'Basic Materials'],
+            'industry': ['Software', 'Oil & Gas', 'Oil & Gas', 'Software', 'Utilities', 'Retail', 'Chemicals'],
+            'market_cap_category': ['Small Cap', 'Mega Cap', 'Large Cap', 'Mega Cap', 'Small Cap', None, None],
+            'pe_ratio': [30.0, 12.0, 9.0, 35.0, 18.0, 22.0, None],
+        })
+
+    def test_columns_become_categories_with_the_same_values(self, stocks):
+        result = _with_categorical_dtypes(stocks.copy())
+
+        for column in sfs.CATEGORICAL_COLUMNS:
+            assert isinstance(result[column].dtype, pd.CategoricalDtype)
+            assert result[column].astype(object).where(result[column].notna(), None).tolist() == \
+                stocks[column].tolist()
+        assert result['symbol'].dtype == object
+
+    @pytest.mark.parametrize("column", sfs.CATEGORICAL_COLUMNS)
+    def test_value_counts_match_text_columns(self, stocks, column):
+        expected = stocks[column].value_counts()
+        result = _with_categorical_dtypes(stocks.copy())[column].value_counts()
+
+        # Ties keep the same order, so the distribution charts are unchanged
+        assert result.index.tolist() == expected.index.tolist()
+        assert result.tolist() == expected.tolist()
+
+    @pytest.mark.parametrize("column", sfs.CATEGORICAL_COLUMNS)
+    def test_observed_groupby_matches_text_columns(self, stocks, column):
+        expected = stocks.groupby(column)['pe_ratio'].mean()
+        result = _with_categorical_dtypes(stocks.copy()).groupby(column, observed=True)['pe_ratio'].mean()
+
+        assert sorted(result.index.tolist()) == expected.index.tolist()
+        pd.testing.assert_series_equal(
+            result.rename(index=str).sort_index(), expected, check_index_type=False
+        )
+
+    def test_isin_matches_text_columns(self, stocks):
+        result = _with_categorical_dtypes(stocks.copy())
+
+        assert result['sector'].isin(['Energy', 'Utilities']).tolist() == \
+            stocks['sector'].isin(['Energy', 'Utilities']).tolist()
+
+    def test_split_records_carry_plain_labels(self, stocks):
+        expected = stocks.to_dict('split', index=False)
+        result = _with_categorical_dtypes(stocks.copy()).to_dict('split', index=False)
+
+        assert result['columns'] == expected['columns']
+        for result_row, expected_row in zip(result['data'], expected['data']):
+            assert [None if pd.isna(v) else v for v in result_row] == \
+                [None if pd.isna(v) else v for v in expected_row]